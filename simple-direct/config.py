@@ -26,6 +26,10 @@ SESSION_NAME = os.getenv('SESSION_NAME', 'telegram_monitor')
 MT5_LOGIN = int(os.getenv('MT5_LOGIN', '0'))
 MT5_PASSWORD = os.getenv('MT5_PASSWORD', '')
 MT5_SERVER = os.getenv('MT5_SERVER', '')
+MT5_KEEPALIVE_INTERVAL = float(os.getenv('MT5_KEEPALIVE_INTERVAL', '10'))  # Seconds between terminal health checks (0 disables auto-reconnect)
+MT5_ASYNC_SEND = os.getenv('MT5_ASYNC_SEND', '1') == '1'  # Send a signal's orders in parallel (0 = one after another)
+MT5_SEND_TIMEOUT = float(os.getenv('MT5_SEND_TIMEOUT', '3'))  # Seconds to wait for each parallel order_send before reporting it unconfirmed - the order may still be placed (0 waits forever, never unconfirmed)
+EVENT_LOOP_CPU = int(os.getenv('EVENT_LOOP_CPU', '-1'))  # CPU core to pin the event loop thread to (-1 leaves it to the OS scheduler)
 
 # =============================================================================
 # TRADING CONFIGURATION
@@ -38,6 +42,7 @@ PARTIALS_VOLUME = float(os.getenv('PARTIALS_VOLUME', '0.02'))      # Volume to c
 PARTIALS_VOLUME_MULTI = float(os.getenv('PARTIALS_VOLUME_MULTI', '0.01'))      # Volume to close for partial profits (multi-entry)
 ENTRY_STRATEGY = os.getenv('ENTRY_STRATEGY', 'adaptive')  # adaptive, midpoint, range_break, momentum, dual_entry, multi_tp_entry, multi_position_entry
 MAGIC_NUMBER = int(os.getenv('MAGIC_NUMBER', '123456'))
+ORDER_MIRROR_INTERVAL = float(os.getenv('ORDER_MIRROR_INTERVAL', '0'))  # Seconds between background orders/positions polls for check_order_status (0 = off, query MT5 on demand)
 
 # Multi-TP Strategy Configuration
 MULTI_TP_PIPS = [200, 400, 600, 800]  # TP1, TP2, TP3, TP4 in pips (TP5 uses signal's TP)
@@ -108,6 +113,11 @@ OVH_APPLICATION_SECRET = os.getenv('OVH_APPLICATION_SECRET')
 OVH_CONSUMER_KEY = os.getenv('OVH_CONSUMER_KEY')
 OVH_SERVICE_NAME = os.getenv('OVH_SERVICE_NAME')  # Your VPS service name (e.g., 'vpsXXXXXX.ovh.net')
 
+# =============================================================================
+# HEALTH SERVER CONFIGURATION
+# =============================================================================
+HEALTH_SNAPSHOT_INTERVAL = float(os.getenv('HEALTH_SNAPSHOT_INTERVAL', '2'))  # Seconds between MT5 snapshot refreshes for /health
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
@@ -6,8 +6,12 @@ Sends logs to n8n for Telegram notifications
 """
 
 import asyncio
+import atexit
+import concurrent.futures
 import logging
+import logging.handlers
 import os
+import queue
 import re
 import requests
 import sys
@@ -27,7 +31,7 @@ from config import *
 
 # Import modular components
 from telegram_logger import TelegramLogger, TelegramFeedback
-from mt5_client import MT5TradingClient
+from mt5_client import MT5TradingClient, _log_verify_error, _pip_value
 from signal_parser import TradingSignalParser
 from health_server import BotHealthServer
 
@@ -43,6 +47,31 @@ except ImportError:
 
 # Configuration loaded from config.py
 
+# Multi-position layout by the boundary closest to price: (zone, volume, tp_pips) in tp_level order.
+# 4 positions at the closest boundary (first 2 double volume) + 3 at MIDDLE + 1 at the other boundary
+_MULTI_POSITION_LAYOUT = {
+    'start': (
+        ('start', 0.02, 200), ('start', 0.02, 400), ('start', 0.01, 600), ('start', 0.01, 800),
+        ('middle', 0.01, 200), ('middle', 0.01, 400), ('middle', 0.01, 600),
+        ('end', 0.01, 200),
+    ),
+    'end': (
+        ('start', 0.01, 200),
+        ('middle', 0.01, 200), ('middle', 0.01, 400), ('middle', 0.01, 600),
+        ('end', 0.02, 200), ('end', 0.02, 400), ('end', 0.01, 600), ('end', 0.01, 800),
+    ),
+}
+# calculate_entry_price implementation per ENTRY_STRATEGY - any other strategy enters at the range middle
+_ENTRY_CALC_BY_STRATEGY = {
+    'midpoint': '_entry_midpoint',
+    'dual_entry': '_entry_dual',
+    'multi_position_entry': '_entry_multi_position',
+}
+_MULTI_POSITION_DISTRIBUTION = {
+    'start': "4 at START (first 2 double volume) + 3 at MIDDLE + 1 at END",
+    'end': "1 at START + 3 at MIDDLE + 4 at END (first 2 double volume)",
+}
+
 # Custom logging handler to detect system clock errors and trigger restart
 class SystemClockErrorHandler(logging.Handler):
     """Custom logging handler that triggers VPS restart on system clock errors"""
@@ -112,7 +141,7 @@ class SystemClockErrorHandler(logging.Handler):
             
             response = requests.post(restart_url, timeout=30)
             
-            if response.status_code == 200:
+            if response.status_code in (200, 202):
                 result = response.json()
                 logger.info("✅ VPS restart initiated successfully!")
                 logger.info(f"   Response: {result.get('message', 'No message')}")
@@ -124,15 +153,21 @@ class SystemClockErrorHandler(logging.Handler):
             logger = logging.getLogger(__name__)
             logger.error(f"❌ Failed to trigger automatic restart: {e}")
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('direct_mt5_monitor.log', encoding='utf-8'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Set up logging - records go through a queue and a listener thread does the file/stdout writes,
+# so a slow disk or console never blocks the event loop while orders are being placed
+_log_handlers = [
+    logging.FileHandler('direct_mt5_monitor.log', encoding='utf-8'),
+    logging.StreamHandler(sys.stdout)
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+_log_queue = queue.SimpleQueue()
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))  # Final format is applied by the listener's handlers
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+log_listener.start()
+atexit.register(log_listener.stop)  # Flush queued records on exit
 logger = logging.getLogger(__name__)
 
 # Add the system clock error handler to the root logger
@@ -157,40 +192,11 @@ class TelegramMonitor:
         self.telegram_logger = TelegramLogger(N8N_LOG_WEBHOOK)
         self.telegram_feedback = TelegramFeedback(N8N_TELEGRAM_FEEDBACK)
         self.health_server = BotHealthServer(port=8080, bot_instance=self)
+        self._entry_calc = getattr(self, _ENTRY_CALC_BY_STRATEGY.get(ENTRY_STRATEGY, '_entry_range_midpoint'))
     
     def check_order_status(self, order_id: int = None):
-        """Check status of orders and positions"""
-        logger.info(f"🔍 CHECKING ORDER STATUS:")
-        
-        # Get all pending orders
-        orders = mt5.orders_get()
-        if orders:
-            logger.info(f"   📋 PENDING ORDERS ({len(orders)}):")
-            for order in orders:
-                distance = abs(order.price_open - order.price_current) if order.price_current else 0
-                # Get order type name
-                order_type_names = {
-                    0: "BUY", 1: "SELL", 2: "BUY_LIMIT", 3: "SELL_LIMIT", 
-                    4: "BUY_STOP", 5: "SELL_STOP", 6: "BUY_STOP_LIMIT", 7: "SELL_STOP_LIMIT"
-                }
-                type_name = order_type_names.get(order.type, f"TYPE_{order.type}")
-                logger.info(f"     Order {order.ticket}: {order.symbol} {type_name}")
-                logger.info(f"       Entry: {order.price_open}, Current: {order.price_current}, Distance: {distance:.5f}")
-                logger.info(f"       V: {order.volume_initial}, SL: {order.sl}, TP: {order.tp}")
-        else:
-            logger.info(f"   📋 No pending orders")
-        
-        # Get open positions
-        positions = mt5.positions_get()
-        if positions:
-            logger.info(f"   📍 OPEN POSITIONS ({len(positions)}):")
-            for pos in positions:
-                # Get position type name
-                pos_type_name = "BUY" if pos.type == 0 else "SELL"
-                logger.info(f"     Position {pos.ticket}: {pos.symbol} {pos_type_name}")
-                logger.info(f"       Open: {pos.price_open}, Current: {pos.price_current}, Profit: ${pos.profit}")
-        else:
-            logger.info(f"   📍 No open positions")
+        """Check status of orders and positions using MT5TradingClient"""
+        self.mt5_client.check_order_status(order_id, verbose=True)
     
     def get_current_price(self, symbol: str):
         """Get current bid/ask prices using MT5TradingClient"""
@@ -207,135 +213,24 @@ class TelegramMonitor:
         prices = self.get_current_price(symbol)
         current_price = prices['ask'] if direction == 'buy' else prices['bid'] if prices else None
         
-        # DEBUG: Log market information
-        logger.info(f"🔍 DEBUGGING ORDER PLACEMENT:")
-        logger.info(f"   Direction: {direction.upper()}")
-        logger.info(f"   Signal Range: {range_start} - {range_end}")
-        logger.info(f"   Current Market: Bid={prices['bid'] if prices else 'N/A'}, Ask={prices['ask'] if prices else 'N/A'}")
-        logger.info(f"   Reference Price ({direction}): {current_price}")
-        logger.info(f"   Strategy: {ENTRY_STRATEGY}")
+        # The whole calculation is logged as one record at the end - lines are only built when INFO is enabled
+        log_lines = [
+            f"🔍 DEBUGGING ORDER PLACEMENT:",
+            f"   Direction: {direction.upper()}",
+            f"   Signal Range: {range_start} - {range_end}",
+            f"   Current Market: Bid={prices['bid'] if prices else 'N/A'}, Ask={prices['ask'] if prices else 'N/A'}",
+            f"   Reference Price ({direction}): {current_price}",
+            f"   Strategy: {ENTRY_STRATEGY}",
+        ] if logger.isEnabledFor(logging.INFO) else None
         
-        if ENTRY_STRATEGY == 'midpoint':
-            entry_price = (range_start + range_end) / 2
-            logger.info(f"   📍 MIDPOINT Strategy: Entry = {entry_price}")
-            
-        elif ENTRY_STRATEGY == 'dual_entry':
-            # Calculate dual entry points at 1/3 and 2/3 of the range
-            range_span = range_end - range_start
-            entry_1 = range_start + (range_span / 3)  # 1/3 point
-            entry_2 = range_start + (2 * range_span / 3)  # 2/3 point
-            
-            logger.info(f"   📍 DUAL_ENTRY Strategy:")
-            logger.info(f"      Range: {range_start} - {range_end} (span: {range_span})")
-            logger.info(f"      Entry 1 (1/3): {entry_1}")
-            logger.info(f"      Entry 2 (2/3): {entry_2}")
-            logger.info(f"      Volume each: 0.07")
-            
-            # Return both entry points for dual execution
-            entry_price = entry_1  # Primary entry for main logic
-            
-        elif ENTRY_STRATEGY == 'multi_position_entry':
-            # Multi-Position strategy: Fixed entry points at range boundaries
-            # 4 positions at range END, 3 at MIDDLE, 2 at START
-            entry_price = current_price  # Use current price as reference
-            range_middle = range_start + ((range_end - range_start) / 2)
-            
-            logger.info(f"   📍 MULTI_POSITION_ENTRY Strategy ({direction.upper()}):")
-            logger.info(f"   📊 Will open {NUMBER_POSITIONS_MULTI} positions with BOUNDARY-based distribution")
-            logger.info(f"   📊 Range: {range_start} (START) - {range_middle} (MIDDLE) - {range_end} (END)")
-            logger.info(f"   📊 Logic: 4 positions at boundary closest to price + 3 at MIDDLE + 2 at other boundary")
-            logger.info(f"   📊 Standard volume: {POSITION_VOLUME_MULTI}, First position at closest boundary: {2 * POSITION_VOLUME_MULTI} (DOUBLE)")
-            logger.info(f"   📊 Total Volume: {(NUMBER_POSITIONS_MULTI - 1) * POSITION_VOLUME_MULTI + (2 * POSITION_VOLUME_MULTI)}")
-            logger.info(f"   📊 TP levels: 200, 400, 600, 800 pips per zone from entry")
-            
-        else:
-            entry_price = (range_start + range_end) / 2
+        # Symbol info for normalization (served from the client's symbol table)
+        symbol_info = self.mt5_client._get_symbol_info(symbol)
         
-        # Get symbol info for normalization and prepare dual entry data if needed
-        symbol_info = mt5.symbol_info(symbol)
-        if symbol_info:
-            digits = symbol_info.digits
-            entry_price = round(entry_price, digits)
-        
-        # Prepare multi-entry data for dual_entry strategies
-        multi_entries = None
-        if ENTRY_STRATEGY == 'dual_entry':
-            range_span = range_end - range_start
-            entry_1 = round(range_start + (range_span / 3), digits) if symbol_info else range_start + (range_span / 3)
-            entry_2 = round(range_start + (2 * range_span / 3), digits) if symbol_info else range_start + (2 * range_span / 3)
-            multi_entries = [
-                {'price': entry_1, 'volume': 0.07},
-                {'price': entry_2, 'volume': 0.07}
-            ]
-        elif ENTRY_STRATEGY == 'multi_position_entry':
-            # Multi-Position strategy: Fixed entry points at range boundaries
-            # BUY: 4 at END, 3 at MIDDLE, 2 at START | SELL: 2 at END, 3 at MIDDLE, 4 at START
-            # Each with TP starting from 200, 400, 600, 800 pips per zone
-            range_span = range_end - range_start
-            range_middle = range_start + (range_span / 2)
-            
-            # Simple approach: Create array of positions with price, volume, and TP
-            # Determine which boundary is closest to current price
-            if current_price is None:
-                closest_to_price = 'start'
-                logger.info(f"   ⚠️  No current price available, defaulting 4 positions to START")
-            else:
-                distance_to_start = abs(current_price - range_start)
-                distance_to_end = abs(current_price - range_end)
-                closest_to_price = 'start' if distance_to_start <= distance_to_end else 'end'
-                
-                logger.info(f"   📍 BOUNDARY-BASED DISTRIBUTION:")
-                logger.info(f"      Current Price: {current_price}")
-                logger.info(f"      Range: {range_start} (START) - {range_middle} (MIDDLE) - {range_end} (END)")
-                logger.info(f"      Distances: START={distance_to_start:.2f}, END={distance_to_end:.2f}")
-                logger.info(f"      ✅ 4 positions will be placed at {closest_to_price.upper()} (closest to price)")
-            
-            # Create multi_entries directly with correct volumes
-            multi_entries = []
-            
-            if closest_to_price == 'start':
-                logger.info(f"      📊 Distribution: 4 at START (first 2 double volume) + 3 at MIDDLE + 1 at END")
-                # 4 positions at START (closest to price) - first 2 get double volume
-                multi_entries.extend([
-                    {'price': round(range_start, symbol_info.digits) if symbol_info else range_start, 'volume': 0.02, 'tp_pips': 200, 'tp_level': 1, 'position_zone': 'start'},
-                    {'price': round(range_start, symbol_info.digits) if symbol_info else range_start, 'volume': 0.02, 'tp_pips': 400, 'tp_level': 2, 'position_zone': 'start'},
-                    {'price': round(range_start, symbol_info.digits) if symbol_info else range_start, 'volume': 0.01, 'tp_pips': 600, 'tp_level': 3, 'position_zone': 'start'},
-                    {'price': round(range_start, symbol_info.digits) if symbol_info else range_start, 'volume': 0.01, 'tp_pips': 800, 'tp_level': 4, 'position_zone': 'start'},
-                ])
-                # 3 positions at MIDDLE
-                multi_entries.extend([
-                    {'price': round(range_middle, symbol_info.digits) if symbol_info else range_middle, 'volume': 0.01, 'tp_pips': 200, 'tp_level': 5, 'position_zone': 'middle'},
-                    {'price': round(range_middle, symbol_info.digits) if symbol_info else range_middle, 'volume': 0.01, 'tp_pips': 400, 'tp_level': 6, 'position_zone': 'middle'},
-                    {'price': round(range_middle, symbol_info.digits) if symbol_info else range_middle, 'volume': 0.01, 'tp_pips': 600, 'tp_level': 7, 'position_zone': 'middle'},
-                ])
-                # 1 position at END
-                multi_entries.append({'price': round(range_end, symbol_info.digits) if symbol_info else range_end, 'volume': 0.01, 'tp_pips': 200, 'tp_level': 8, 'position_zone': 'end'})
-            else:  # closest_to_price == 'end'
-                logger.info(f"      📊 Distribution: 1 at START + 3 at MIDDLE + 4 at END (first 2 double volume)")
-                # 1 position at START
-                multi_entries.append({'price': round(range_start, symbol_info.digits) if symbol_info else range_start, 'volume': 0.01, 'tp_pips': 200, 'tp_level': 1, 'position_zone': 'start'})
-                # 3 positions at MIDDLE
-                multi_entries.extend([
-                    {'price': round(range_middle, symbol_info.digits) if symbol_info else range_middle, 'volume': 0.01, 'tp_pips': 200, 'tp_level': 2, 'position_zone': 'middle'},
-                    {'price': round(range_middle, symbol_info.digits) if symbol_info else range_middle, 'volume': 0.01, 'tp_pips': 400, 'tp_level': 3, 'position_zone': 'middle'},
-                    {'price': round(range_middle, symbol_info.digits) if symbol_info else range_middle, 'volume': 0.01, 'tp_pips': 600, 'tp_level': 4, 'position_zone': 'middle'},
-                ])
-                # 4 positions at END (closest to price) - first 2 get double volume
-                multi_entries.extend([
-                    {'price': round(range_end, symbol_info.digits) if symbol_info else range_end, 'volume': 0.02, 'tp_pips': 200, 'tp_level': 5, 'position_zone': 'end'},
-                    {'price': round(range_end, symbol_info.digits) if symbol_info else range_end, 'volume': 0.02, 'tp_pips': 400, 'tp_level': 6, 'position_zone': 'end'},
-                    {'price': round(range_end, symbol_info.digits) if symbol_info else range_end, 'volume': 0.01, 'tp_pips': 600, 'tp_level': 7, 'position_zone': 'end'},
-                    {'price': round(range_end, symbol_info.digits) if symbol_info else range_end, 'volume': 0.01, 'tp_pips': 800, 'tp_level': 8, 'position_zone': 'end'},
-                ])
-            
-            # Set entry_price as range middle for multi-position strategy (representative value)
-            entry_price = range_middle
-            
-            # Log final configuration
-            logger.info(f"   📊 FINAL POSITION CONFIGURATION:")
-            for i, entry in enumerate(multi_entries[:NUMBER_POSITIONS_MULTI], 1):
-                volume_label = "DOUBLE" if entry['volume'] == 0.02 else "standard"
-                logger.info(f"      Position {i}: {entry['position_zone'].upper()} @ {entry['price']}, Vol: {entry['volume']} ({volume_label}), TP: {entry['tp_pips']} pips")
+        # Strategy-specific calculation, bound once in __init__ from ENTRY_STRATEGY
+        entry_price, multi_entries = self._entry_calc(direction, range_start, range_end, current_price, symbol_info, log_lines)
+        
+        if log_lines is not None:
+            logger.info("\n".join(log_lines))
         
         return {
             'entry_price': entry_price,
@@ -346,8 +241,100 @@ class TelegramMonitor:
             'range_end': range_end,
             'multi_entries': multi_entries  # None for single, [{'price': x, 'volume': y}, ...] for multi-entry
         }
+    
+    def _entry_range_midpoint(self, direction, range_start, range_end, current_price, symbol_info, log_lines):
+        """Entry at the middle of the range (default for single-entry strategies)"""
+        entry_price = (range_start + range_end) / 2
+        return (round(entry_price, symbol_info.digits) if symbol_info else entry_price), None
+    
+    def _entry_midpoint(self, direction, range_start, range_end, current_price, symbol_info, log_lines):
+        """MIDPOINT strategy - entry at the middle of the range"""
+        if log_lines is not None:
+            log_lines.append(f"   📍 MIDPOINT Strategy: Entry = {(range_start + range_end) / 2}")
+        return self._entry_range_midpoint(direction, range_start, range_end, current_price, symbol_info, log_lines)
+    
+    def _entry_dual(self, direction, range_start, range_end, current_price, symbol_info, log_lines):
+        """DUAL_ENTRY strategy - two entries at 1/3 and 2/3 of the range"""
+        range_span = range_end - range_start
+        entry_1 = range_start + (range_span / 3)  # 1/3 point
+        entry_2 = range_start + (2 * range_span / 3)  # 2/3 point
+        
+        if log_lines is not None:
+            log_lines += [
+                f"   📍 DUAL_ENTRY Strategy:",
+                f"      Range: {range_start} - {range_end} (span: {range_span})",
+                f"      Entry 1 (1/3): {entry_1}",
+                f"      Entry 2 (2/3): {entry_2}",
+                f"      Volume each: 0.07",
+            ]
+        
+        if symbol_info:
+            digits = symbol_info.digits
+            entry_1 = round(entry_1, digits)
+            entry_2 = round(entry_2, digits)
+        multi_entries = [
+            {'price': entry_1, 'volume': 0.07},
+            {'price': entry_2, 'volume': 0.07}
+        ]
+        return entry_1, multi_entries  # Primary entry for main logic is the 1/3 point
+    
+    def _entry_multi_position(self, direction, range_start, range_end, current_price, symbol_info, log_lines):
+        """MULTI_POSITION_ENTRY strategy - positions spread over the range boundaries, see _MULTI_POSITION_LAYOUT"""
+        range_middle = range_start + ((range_end - range_start) / 2)
+        
+        if log_lines is not None:
+            log_lines += [
+                f"   📍 MULTI_POSITION_ENTRY Strategy ({direction.upper()}):",
+                f"   📊 Will open {NUMBER_POSITIONS_MULTI} positions with BOUNDARY-based distribution",
+                f"   📊 Range: {range_start} (START) - {range_middle} (MIDDLE) - {range_end} (END)",
+                f"   📊 Logic: 4 positions at boundary closest to price + 3 at MIDDLE + 2 at other boundary",
+                f"   📊 Standard volume: {POSITION_VOLUME_MULTI}, First position at closest boundary: {2 * POSITION_VOLUME_MULTI} (DOUBLE)",
+                f"   📊 Total Volume: {(NUMBER_POSITIONS_MULTI - 1) * POSITION_VOLUME_MULTI + (2 * POSITION_VOLUME_MULTI)}",
+                f"   📊 TP levels: 200, 400, 600, 800 pips per zone from entry",
+            ]
+        
+        # Determine which boundary is closest to current price
+        if current_price is None:
+            closest_to_price = 'start'
+            if log_lines is not None:
+                log_lines.append(f"   ⚠️  No current price available, defaulting 4 positions to START")
+        else:
+            # START is closest when the price sits on START's side of the middle (ties go to START)
+            closest_to_price = 'start' if (current_price - range_middle) * (range_start - range_end) >= 0 else 'end'
+            
+            if log_lines is not None:
+                log_lines += [
+                    f"   📍 BOUNDARY-BASED DISTRIBUTION:",
+                    f"      Current Price: {current_price}",
+                    f"      Range: {range_start} (START) - {range_middle} (MIDDLE) - {range_end} (END)",
+                    f"      Distances: START={abs(current_price - range_start):.2f}, END={abs(current_price - range_end):.2f}",
+                    f"      ✅ 4 positions will be placed at {closest_to_price.upper()} (closest to price)",
+                ]
+        
+        # Build multi_entries from the layout table - one rounded price per zone
+        zone_prices = {'start': range_start, 'middle': range_middle, 'end': range_end}
+        if symbol_info:
+            digits = symbol_info.digits
+            zone_prices = {zone: round(price, digits) for zone, price in zone_prices.items()}
+        multi_entries = [
+            {'price': zone_prices[zone], 'volume': volume, 'tp_pips': tp_pips, 'tp_level': tp_level, 'position_zone': zone}
+            for tp_level, (zone, volume, tp_pips) in enumerate(_MULTI_POSITION_LAYOUT[closest_to_price], 1)
+        ]
+        
+        # Log final configuration
+        if log_lines is not None:
+            log_lines.append(f"      📊 Distribution: {_MULTI_POSITION_DISTRIBUTION[closest_to_price]}")
+            log_lines.append(f"   📊 FINAL POSITION CONFIGURATION:")
+            log_lines += [
+                f"      Position {i}: {entry['position_zone'].upper()} @ {entry['price']}, Vol: {entry['volume']} "
+                f"({'DOUBLE' if entry['volume'] == 0.02 else 'standard'}), TP: {entry['tp_pips']} pips"
+                for i, entry in enumerate(multi_entries[:NUMBER_POSITIONS_MULTI], 1)
+            ]
+        
+        # Range middle is the representative entry price for multi-position strategy
+        return range_middle, multi_entries
 
-    def execute_trade(self, signal: Dict[str, Any], entry_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def execute_trade(self, signal: Dict[str, Any], entry_data: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the trading signal - Handle both single and dual entry strategies"""
         try:
             symbol = signal['symbol']
@@ -360,20 +347,20 @@ class TelegramMonitor:
                 if len(multi_entries) == 2:
                     logger.info(f"🎯 DUAL ENTRY STRATEGY DETECTED!")
                     logger.info(f"   Placing TWO orders with 0.07 volume each")
-                    return self.mt5_client._execute_multi_trades(signal, multi_entries)
+                    return await self.mt5_client._execute_multi_trades(signal, multi_entries)
                 elif len(multi_entries) == NUMBER_POSITIONS_MULTI and multi_entries[0].get('position_zone'):
                     logger.info(f"🎯 MULTI-POSITION ENTRY STRATEGY DETECTED!")
                     total_vol = sum(entry['volume'] for entry in multi_entries)
                     logger.info(f"   Placing {NUMBER_POSITIONS_MULTI} orders distributed across range, total volume: {total_vol}")
                     logger.info(f"   Position distribution: 4 close + 3 middle + 2 outer")
-                    return self.mt5_client._execute_multi_tp_trades(signal, multi_entries)
+                    return await self.mt5_client._execute_multi_tp_trades(signal, multi_entries)
                 else:
                     # Fallback for other multi-entry strategies
-                    return self.mt5_client._execute_multi_trades(signal, multi_entries)
+                    return await self.mt5_client._execute_multi_trades(signal, multi_entries)
             
             # Single entry logic
-            # Get current market price for comparison
-            tick = mt5.symbol_info_tick(symbol)
+            # Get current market price for comparison - reuses the tick calculate_entry_price just fetched
+            tick = self.mt5_client._get_tick(symbol)
             if not tick:
                 return {
                     'success': False,
@@ -447,8 +434,10 @@ class TelegramMonitor:
             logger.info(f"   Return Code: {result.retcode}")
             logger.info(f"   Comment: {result.comment}")
             
-            # Check order status immediately after placement
-            self.check_order_status()
+            # Check order status after placement - diagnostic only, so it runs off the order path
+            if logger.isEnabledFor(logging.INFO):
+                future = asyncio.get_running_loop().run_in_executor(None, self.check_order_status)
+                future.add_done_callback(_log_verify_error)
             
             return {
                 'success': True,
@@ -478,6 +467,7 @@ class TelegramMonitor:
         self.telegram_logger = TelegramLogger(N8N_LOG_WEBHOOK)
         self.telegram_feedback = TelegramFeedback(N8N_TELEGRAM_FEEDBACK)
         self.health_server = BotHealthServer(port=8080, bot_instance=self)
+        self._entry_calc = getattr(self, _ENTRY_CALC_BY_STRATEGY.get(ENTRY_STRATEGY, '_entry_range_midpoint'))
     
     def should_ignore_message(self, message_text: str) -> bool:
         """Check if message contains common words/phrases that should be ignored"""
@@ -654,11 +644,9 @@ class TelegramMonitor:
                 is_in_loss = current_profit < 0
                 
                 # Get symbol info for pip calculation
-                symbol_info = mt5.symbol_info(pos.symbol)
-                if symbol_info:
-                    pip_value = 10 ** (-symbol_info.digits + (1 if symbol_info.digits == 5 or symbol_info.digits == 3 else 0))
-                else:
-                    pip_value = 0.0001  # Default for most pairs
+                symbol_info = self.mt5_client._get_symbol_info(pos.symbol)
+                digits = symbol_info.digits if symbol_info else None
+                pip_value = _pip_value(symbol_info)  # Digits table lookup, 0.0001 without symbol info
                 
                 if is_in_loss:
                     # Position is in loss - move SL to current price - 500 pips
@@ -672,7 +660,7 @@ class TelegramMonitor:
                         
                     # Round to symbol digits
                     if symbol_info:
-                        new_sl = round(new_sl, symbol_info.digits)
+                        new_sl = round(new_sl, digits)
                     
                     logger.info(f"   📉 Position {pos.ticket} IN LOSS (${current_profit:.2f}):")
                     logger.info(f"      Using LOSS PROTECTION: Current Price - 500 pips")
@@ -1375,7 +1363,7 @@ class TelegramMonitor:
         logger.info(f"   ✅ Successfully moved: {success_count}")
         logger.info(f"   ❌ Failed to move: {total_positions - success_count}")
     
-    def process_trading_signal(self, message_text: str): 
+    async def process_trading_signal(self, message_text: str): 
         """Process and execute trading signal"""
         try:
             # Early exit: Check ignore words before any processing
@@ -1470,7 +1458,7 @@ class TelegramMonitor:
                 logger.info(f"🎯 Multi-position strategy: Multiple entry points calculated")
             
             # Execute limit order
-            result = self.execute_trade(signal, entry_data)
+            result = await self.execute_trade(signal, entry_data)
             
             # Log execution result and send Telegram feedback
             self.telegram_logger.log_trade_execution(signal, result)
@@ -1504,7 +1492,7 @@ class TelegramMonitor:
                 if message.text:
                     logger.info(f"   ✅ Message text found: {message.text[:100]}...")
                     logger.info(f"   🎯 CALLING process_trading_signal()")
-                    self.process_trading_signal(message.text)
+                    await self.process_trading_signal(message.text)
                 else:
                     # Check if it's a video message specifically
                     if message.media and hasattr(message.media, 'document') and message.media.document:
@@ -1574,6 +1562,13 @@ class TelegramMonitor:
         # Send single startup notification to Telegram
         self.telegram_feedback.notify_system_status('started', f"Strategy: {ENTRY_STRATEGY}, V: {DEFAULT_VOLUME}")
         
+        # Pin the event loop last - the MT5, health and logging threads started above keep every core,
+        # and worker pools created from here on reset their threads to every core as they start
+        if EVENT_LOOP_CPU >= 0 and _pin_event_loop_thread(EVENT_LOOP_CPU):
+            asyncio.get_running_loop().set_default_executor(
+                concurrent.futures.ThreadPoolExecutor(initializer=_unpin_thread))
+            self.mt5_client.thread_initializer = _unpin_thread
+        
         try:
             await self.client.run_until_disconnected()
         except KeyboardInterrupt:
@@ -1640,7 +1635,7 @@ class TelegramMonitor:
             
             response = requests.post(restart_url, timeout=30)
             
-            if response.status_code == 200:
+            if response.status_code in (200, 202):
                 result = response.json()
                 logger.info("✅ Emergency VPS restart initiated successfully!")
                 logger.info(f"   Response: {result.get('message', 'No message')}")
@@ -1652,6 +1647,45 @@ class TelegramMonitor:
             logger.error(f"❌ Failed to trigger emergency restart: {e}")
 
 
+# CPUs the process could use before the event loop was pinned (Linux) - restored by _unpin_thread
+_UNPINNED_CPUS = None
+
+
+def _unpin_thread():
+    """Give the calling thread every CPU back - Linux threads inherit the pinned mask of the loop thread that starts them"""
+    if _UNPINNED_CPUS is not None:
+        os.sched_setaffinity(0, _UNPINNED_CPUS)
+
+
+def _pin_event_loop_thread(cpu: int) -> bool:
+    """Pin the calling thread (the event loop) to one CPU core so it is not migrated mid order burst"""
+    global _UNPINNED_CPUS
+    try:
+        if sys.platform.startswith('win'):
+            # New Windows threads start with the process mask, so only the loop thread is affected
+            import ctypes
+            from ctypes import wintypes
+            kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+            kernel32.GetCurrentThread.argtypes = ()
+            kernel32.GetCurrentThread.restype = wintypes.HANDLE
+            kernel32.SetThreadAffinityMask.argtypes = (wintypes.HANDLE, ctypes.c_size_t)  # DWORD_PTR mask
+            kernel32.SetThreadAffinityMask.restype = ctypes.c_size_t  # Previous mask, 0 on failure
+            if not kernel32.SetThreadAffinityMask(kernel32.GetCurrentThread(), 1 << cpu):
+                raise OSError(f"SetThreadAffinityMask failed (error {ctypes.get_last_error()})")
+        elif hasattr(os, 'sched_setaffinity'):
+            cpus = os.sched_getaffinity(0)
+            os.sched_setaffinity(0, {cpu})  # Linux: 0 is the calling thread only
+            _UNPINNED_CPUS = cpus
+        else:
+            logger.warning(f"⚠️ CPU pinning not supported on {sys.platform} - EVENT_LOOP_CPU ignored")
+            return False
+    except Exception as e:
+        logger.error(f"❌ Could not pin event loop to CPU {cpu}: {e}")
+        return False
+    logger.info(f"📌 Event loop pinned to CPU {cpu}")
+    return True
+
+
 async def main():
     """Main entry point"""
     # Start main bot (health server starts automatically in TelegramMonitor.__init__)
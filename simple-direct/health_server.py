@@ -3,13 +3,17 @@ Health Server Module
 Contains HTTP server classes for bot health monitoring and status checks.
 """
 
+import concurrent.futures
+import functools
+import hashlib
 import json
 import logging
+import mmap
 import os
+import socket
 import threading
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from datetime import datetime
-from urllib.parse import parse_qs, urlparse
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from config import *
 
 logger = logging.getLogger(__name__)
@@ -32,51 +36,284 @@ except ImportError:
     mt5 = None
     logger.warning("MetaTrader5 not available for health checks")
 
+# Import orjson for faster response encoding (falls back to stdlib json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# Formatted timestamp cache - (epoch second, string), swapped as one tuple so
+# concurrent handler threads never see a mismatched pair
+_ts_cache = (0, "")
+
+
+def _now_fast(t=None):
+    """Format the local time as 'YYYY-MM-DD HH:MM:SS' without building a datetime"""
+    lt = time.localtime(t)
+    return "%04d-%02d-%02d %02d:%02d:%02d" % (lt.tm_year, lt.tm_mon, lt.tm_mday, lt.tm_hour, lt.tm_min, lt.tm_sec)
+
+
+def _now_str():
+    """Return the current time as 'YYYY-MM-DD HH:MM:SS', formatted once per second"""
+    global _ts_cache
+    t = int(time.time())
+    cached = _ts_cache
+    if cached[0] != t:
+        cached = _ts_cache = (t, _now_fast(t))
+    return cached[1]
+
+
+# Worker pool for slow actions (OVH reboot, position management) so they don't
+# block the HTTP server thread
+_executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+
+
+def _dumps(obj, indent=None):
+    """Serialize a response object to JSON bytes - compact unless an indent is given"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=indent).encode()
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+# Health payload skeleton - strategy and volume never change at runtime
+_CONFIG_JSON = _dumps({"strategy": ENTRY_STRATEGY, "volume": DEFAULT_VOLUME})
+_HEALTH_TEMPLATE = (
+    b'{"status":%b,"timestamp":%b,"bot_running":%b,"mt5_available":%b,'
+    b'"mt5_connected":%b,"account":%b,"trades":%b,"config":%b}'
+)
+
+# '/' payload - only the timestamp changes between requests
+_SIMPLE_PREFIX = b'{"message":"MT5 Trading Bot is running","timestamp":"'
+_SIMPLE_SUFFIX = b'","status":"online"}'
+
+
+def _log_background_result(action):
+    """Build a done-callback that logs the outcome of a background action"""
+    def callback(future):
+        try:
+            result = future.result()
+            if result is None:
+                logger.info(f"✅ {action} completed via API")
+            else:
+                logger.info(f"✅ {action} completed via API: {result}")
+        except Exception as e:
+            logger.error(f"Failed to {action.lower()}: {e}")
+    return callback
+
+
+# Log file written by direct_mt5_monitor.py and its running line count
+LOG_FILE = 'direct_mt5_monitor.log'
+_LOG_LINE_COUNT = None
+_log_line_counter = None
+_log_map = {"key": None, "map": None, "file_id": None}
+_log_map_lock = threading.Lock()
+
+# HTML log viewer - the log lines are streamed between prologue and epilogue
+_LOG_HTML_PROLOGUE = """
+            <!DOCTYPE html>
+            <html>
+            <head>
+                <title>MT5 Bot Logs - Last {shown} Lines</title>
+                <style>
+                    body {{ font-family: 'Consolas', 'Monaco', monospace; margin: 20px; background-color: #1e1e1e; color: #d4d4d4; }}
+                    h1 {{ color: #569cd6; }}
+                    .log-info {{ background: #2d2d30; padding: 10px; margin: 10px 0; border-radius: 5px; }}
+                    .log-content {{ background: #0c0c0c; padding: 15px; border-radius: 5px; white-space: pre-wrap; font-size: 12px; overflow-x: auto; }}
+                    .refresh-btn {{ background: #007acc; color: white; padding: 8px 16px; border: none; border-radius: 4px; cursor: pointer; margin: 10px 0; }}
+                    .refresh-btn:hover {{ background: #005a9e; }}
+                </style>
+            </head>
+            <body>
+                <h1>📋 MT5 Trading Bot Logs</h1>
+                
+                <div class="log-info">
+                    <strong>File:</strong> {log_file}<br>
+                    <strong>Total Lines:</strong> {total:,}<br>
+                    <strong>Showing:</strong> Last {shown} lines<br>
+                    <strong>Updated:</strong> {updated}<br>
+                    <button class="refresh-btn" onclick="location.reload()">🔄 Refresh</button>
+                    <a href="/log?format=html&lines=100" class="refresh-btn">📄 Show 100 Lines</a>
+                    <a href="/log?format=json" class="refresh-btn">📊 JSON Format</a>
+                </div>
+                
+                <div class="log-content">"""
+
+_LOG_HTML_EPILOGUE = b"""</div>
+                
+                <script>
+                    // Auto-refresh every 30 seconds
+                    setTimeout(function(){ location.reload(); }, 30000);
+                </script>
+            </body>
+            </html>
+            """
+
+
+def _count_lines(mm):
+    """Count lines in a mapped file the same way readlines() would"""
+    if mm is None:
+        return 0
+    size = len(mm)
+    count = 0
+    for start in range(0, size, 1 << 20):
+        count += mm[start:start + (1 << 20)].count(b'\n')
+    if mm[size - 1:size] != b'\n':
+        count += 1
+    return count
+
+
+def _open_log_map():
+    """Return (file, mmap, size) for the log file, remapping only when it changed on disk"""
+    st = os.stat(LOG_FILE)
+    key = (st.st_mtime_ns, st.st_size)
+    with _log_map_lock:
+        if _log_map["key"] != key:
+            # Older maps stay alive until requests still using them are done
+            f = open(LOG_FILE, 'rb')
+            fst = os.fstat(f.fileno())
+            size = fst.st_size
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+            previous, previous_id = _log_map["map"], _log_map["file_id"]
+            _log_map["key"] = key
+            _log_map["map"] = (f, mm, size)
+            _log_map["file_id"] = (fst.st_dev, fst.st_ino)
+            # Truncated or replaced under the same name - the running count no longer matches
+            if previous is not None and (previous_id != _log_map["file_id"] or size < previous[2]):
+                _reset_log_line_count(mm)
+        return _log_map["map"]
+
+
+def _total_log_lines(mm):
+    """Return the log's line count, from the running counter when it is installed"""
+    if _LOG_LINE_COUNT is not None:
+        return _LOG_LINE_COUNT
+    return _count_lines(mm)
+
+
+class _LogLineCounter(logging.Handler):
+    """Logging handler that keeps _LOG_LINE_COUNT in step with the log file"""
+    
+    def emit(self, record):
+        global _LOG_LINE_COUNT
+        try:
+            _LOG_LINE_COUNT += self.format(record).count('\n') + 1
+        except Exception:
+            self.handleError(record)
+
+
+def _reset_log_line_count(mm):
+    """Recount the log's lines into the running counter, if it is installed"""
+    global _LOG_LINE_COUNT
+    counter = _log_line_counter
+    if counter is None:
+        return
+    counter.acquire()
+    try:
+        _LOG_LINE_COUNT = _count_lines(mm)
+    finally:
+        counter.release()
+
+
+def _install_log_line_counter():
+    """Seed the line counter from the log file once and attach it to the root logger"""
+    global _LOG_LINE_COUNT, _log_line_counter
+    if _log_line_counter is not None:
+        return
+    counter = _LogLineCounter()
+    counter.acquire()
+    try:
+        if os.path.exists(LOG_FILE):
+            _LOG_LINE_COUNT = _count_lines(_open_log_map()[1])
+        else:
+            _LOG_LINE_COUNT = 0
+        logging.getLogger().addHandler(counter)
+        _log_line_counter = counter
+    finally:
+        counter.release()
+
+
+def _tail_offset(mm, lines):
+    """Return the byte offset where the last `lines` lines of a mapped file start"""
+    if mm is None:
+        return 0
+    # A trailing newline terminates the last line, it doesn't start a new one
+    end = max(len(mm) - 1, 0)
+    for _ in range(lines):
+        end = mm.rfind(b'\n', 0, end)
+        if end == -1:
+            return 0
+    return end + 1
+
 
 class BotHealthHandler(BaseHTTPRequestHandler):
     """Simple HTTP handler for bot health checks"""
     
-    def __init__(self, request, client_address, server, bot_instance=None):
+    # Keep connections open between probes; drop idle clients after 15 s
+    protocol_version = 'HTTP/1.1'
+    timeout = 15
+    
+    # Buffer writes so stray small writes (e.g. send_error) leave as one segment
+    wbufsize = 0x4000
+    
+    def __init__(self, request, client_address, server, bot_instance=None, health_server=None):
         self.bot_instance = bot_instance
+        self.health_server = health_server
         super().__init__(request, client_address, server)
     
     def do_GET(self):
         """Handle GET requests"""
-        if self.path == '/health' or self.path == '/status':
-            self.send_health_response()
-        elif self.path == '/alive':
+        path, _, qs = self.path.partition('?')
+        
+        # Parse query parameters for line count, format and pretty-printing
+        lines = 40  # default
+        format_type = 'json'  # default
+        indent = None  # compact by default, ?pretty=1 for humans
+        for part in qs.split('&'):
+            key, _, value = part.partition('=')
+            if key == 'lines':
+                try:
+                    lines = min(max(int(value), 1), 1000)  # Limit between 1 and 1000 lines
+                except ValueError:
+                    lines = 40
+            elif key == 'format':
+                format_type = value.lower()
+                if format_type not in ('json', 'html'):
+                    format_type = 'json'
+            elif key == 'pretty':
+                indent = 2 if value not in ('', '0', 'false') else None
+        
+        if path == '/health' or path == '/status':
+            self.send_health_response(indent)
+        elif path == '/alive':
             self.send_alive_response()
-        elif self.path == '/restart':
+        elif path == '/restart':
             self.send_restart_response()
-        elif self.path.startswith('/log'):
-            # Parse query parameters for line count and format
-            lines = 40  # default
-            format_type = 'json'  # default
-            if '?' in self.path:
-                parsed_url = urlparse(self.path)
-                query_params = parse_qs(parsed_url.query)
-                if 'lines' in query_params:
-                    try:
-                        lines = int(query_params['lines'][0])
-                        lines = min(max(lines, 1), 1000)  # Limit between 1 and 1000 lines
-                    except (ValueError, IndexError):
-                        lines = 40
-                if 'format' in query_params:
-                    format_type = query_params['format'][0].lower()
-                    if format_type not in ['json', 'html']:
-                        format_type = 'json'
-            
+        elif path.startswith('/log'):
             if format_type == 'html':
                 self.send_log_html(lines)
             else:
-                self.send_log_response(lines)
-        elif self.path == '/':
+                self.send_log_response(lines, indent)
+        elif path == '/':
             self.send_simple_response()
         else:
             self.send_error(404, "Not Found")
     
     def do_POST(self):
         """Handle POST requests"""
+        # No endpoint reads a body - discard it so a kept-alive connection doesn't parse it as the next request
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            length = -1
+        if length < 0 or 'chunked' in self.headers.get('Transfer-Encoding', '').lower():
+            self.close_connection = True  # Body length unknown - don't reuse the connection
+        elif length:
+            self.rfile.read(length)
+        
         if self.path == '/restart':
             self.send_restart_response()
         elif self.path == '/totalcancel':
@@ -90,477 +327,312 @@ class BotHealthHandler(BaseHTTPRequestHandler):
         else:
             self.send_error(404, "Not Found")
     
-    def send_health_response(self):
+    def _response_head(self, status, content_type, length, etag=None):
+        """Build the status line and headers for a response of the given length"""
+        head = "%s %d %s\r\nContent-type: %s\r\nContent-length: %d\r\n" % (
+            self.protocol_version, status, self.responses[status][0], content_type, length
+        )
+        if etag:
+            head += "ETag: %s\r\n" % etag
+        return (head + "\r\n").encode('latin-1')
+    
+    def _send_bytes(self, status, content_type, body, etag=None):
+        """Send an already encoded response body - headers and body in a single write"""
+        self.wfile.write(self._response_head(status, content_type, len(body), etag) + body)
+        self.wfile.flush()
+    
+    def _send_not_modified(self, etag):
+        """Send a bodiless 304 for a client whose cached copy is still current"""
+        self.wfile.write(("%s 304 Not Modified\r\nETag: %s\r\n\r\n" % (self.protocol_version, etag)).encode('latin-1'))
+        self.wfile.flush()
+    
+    def _write_json(self, status, obj, indent=None):
+        """Serialize obj and send it as a JSON response"""
+        self._send_bytes(status, 'application/json', _dumps(obj, indent))
+    
+    def _write_error(self, status, message):
+        """Send a standard JSON error response"""
+        self._write_json(status, {
+            "status": "error",
+            "message": message,
+            "timestamp": _now_str()
+        })
+    
+    def send_health_response(self, indent=None):
         """Send detailed bot health status"""
         try:
-            # Get current time
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            # MT5 connection, positions, orders and account info from the background snapshot
+            if MT5_AVAILABLE and self.health_server is not None:
+                (mt5_connected, positions, orders, account_info), snap_etag = self.health_server.get_snapshot()
+            else:
+                mt5_connected, positions, orders, account_info, snap_etag = False, (), (), None, "none"
+            
+            # Bot status
+            bot_instance = self.bot_instance
+            bot_running = True if bot_instance is None else getattr(bot_instance, 'running', False)
+            
+            # Nothing changed since the client's copy - skip building the body. Weak etag: the
+            # per-second timestamp is not covered, and ?pretty bodies get their own validator
+            etag = 'W/"%s-%d-%d"' % (snap_etag, 1 if bot_running else 0, 1 if indent else 0)
+            if self.headers.get('If-None-Match') == etag:
+                self._send_not_modified(etag)
+                return
             
-            # Check MT5 connection
-            mt5_connected = mt5.terminal_info() is not None if MT5_AVAILABLE else False
+            # Get current time
+            current_time = _now_str()
             
-            # Get positions and orders count
-            positions_count = len(mt5.positions_get()) if MT5_AVAILABLE and mt5_connected else 0
-            orders_count = len(mt5.orders_get()) if MT5_AVAILABLE and mt5_connected else 0
+            positions_count = len(positions)
+            orders_count = len(orders)
             
-            # Get account info
-            account_info = mt5.account_info() if MT5_AVAILABLE and mt5_connected else None
             balance = f"{account_info.balance:.2f}" if account_info else "N/A"
             equity = f"{account_info.equity:.2f}" if account_info else "N/A"
             
-            # Bot status
-            bot_running = hasattr(self.bot_instance, 'running') and self.bot_instance.running if self.bot_instance else True
-            
-            # Build JSON response
-            health_data = {
-                "status": "healthy" if bot_running and (not MT5_AVAILABLE or mt5_connected) else "unhealthy",
-                "timestamp": current_time,
-                "bot_running": bot_running,
-                "mt5_available": MT5_AVAILABLE,
-                "mt5_connected": mt5_connected,
-                "account": {
-                    "balance": balance,
-                    "equity": equity
-                },
-                "trades": {
-                    "open_positions": positions_count,
-                    "pending_orders": orders_count
-                },
-                "config": {
-                    "strategy": ENTRY_STRATEGY,
-                    "volume": DEFAULT_VOLUME
-                }
-            }
+            # Build JSON response - the static config fragment is pre-serialized
+            response = _HEALTH_TEMPLATE % (
+                _dumps("healthy" if bot_running and (not MT5_AVAILABLE or mt5_connected) else "unhealthy"),
+                _dumps(current_time),
+                _dumps(bot_running),
+                _dumps(MT5_AVAILABLE),
+                _dumps(mt5_connected),
+                _dumps({"balance": balance, "equity": equity}),
+                _dumps({"open_positions": positions_count, "pending_orders": orders_count}),
+                _CONFIG_JSON
+            )
             
-            response = json.dumps(health_data, indent=2)
+            if indent:
+                response = _dumps(json.loads(response), indent)
             
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Content-length', str(len(response)))
-            self.end_headers()
-            self.wfile.write(response.encode())
+            self._send_bytes(200, 'application/json', response, etag)
             
         except Exception as e:
-            error_response = json.dumps({
-                "status": "error", 
-                "message": str(e),
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            })
-            
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Content-length', str(len(error_response)))
-            self.end_headers()
-            self.wfile.write(error_response.encode())
+            self._write_error(500, str(e))
     
     def send_alive_response(self):
         """Send simple alive status - lightweight check"""
         try:
             # Just check if bot is running (minimal overhead)
-            bot_running = hasattr(self.bot_instance, 'running') and self.bot_instance.running if self.bot_instance else True
+            bot_instance = self.bot_instance
+            bot_running = True if bot_instance is None else getattr(bot_instance, 'running', False)
             
             # Simple alive response
-            alive_data = {
+            self._write_json(200, {
                 "alive": bot_running,
                 "status": "running" if bot_running else "stopped",
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
-            
-            response = json.dumps(alive_data)
-            
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Content-length', str(len(response)))
-            self.end_headers()
-            self.wfile.write(response.encode())
+                "timestamp": _now_str()
+            })
             
         except Exception as e:
-            error_response = json.dumps({
+            self._write_json(500, {
                 "alive": False,
                 "status": "error", 
                 "message": str(e),
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                "timestamp": _now_str()
             })
-            
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Content-length', str(len(error_response)))
-            self.end_headers()
-            self.wfile.write(error_response.encode())
     
     def send_restart_response(self):
         """Restart VPS using OVH API"""
         try:
             if not OVH_AVAILABLE:
-                error_response = json.dumps({
-                    "status": "error",
-                    "message": "OVH library not available. Install with: pip install ovh",
-                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                })
-                
-                self.send_response(500)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Content-length', str(len(error_response)))
-                self.end_headers()
-                self.wfile.write(error_response.encode())
+                self._write_error(500, "OVH library not available. Install with: pip install ovh")
                 return
             
-            # Check if OVH credentials are configured (imported from config.py)
-            from config import OVH_ENDPOINT, OVH_APPLICATION_KEY, OVH_APPLICATION_SECRET, OVH_CONSUMER_KEY, OVH_SERVICE_NAME
-            
+            # Check if OVH credentials are configured (bound by the module-level config import)
             if not all([OVH_APPLICATION_KEY, OVH_APPLICATION_SECRET, OVH_CONSUMER_KEY, OVH_SERVICE_NAME]):
-                error_response = json.dumps({
-                    "status": "error",
-                    "message": "OVH credentials not configured. Set OVH_APPLICATION_KEY, OVH_APPLICATION_SECRET, OVH_CONSUMER_KEY, OVH_SERVICE_NAME environment variables",
-                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                })
-                
-                self.send_response(500)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Content-length', str(len(error_response)))
-                self.end_headers()
-                self.wfile.write(error_response.encode())
+                self._write_error(500, "OVH credentials not configured. Set OVH_APPLICATION_KEY, OVH_APPLICATION_SECRET, OVH_CONSUMER_KEY, OVH_SERVICE_NAME environment variables")
                 return
             
-            # Initialize OVH client
-            client = ovh.Client(
-                endpoint=OVH_ENDPOINT,
-                application_key=OVH_APPLICATION_KEY,
-                application_secret=OVH_APPLICATION_SECRET,
-                consumer_key=OVH_CONSUMER_KEY,
-            )
+            # Reuse the OVH client built once by BotHealthServer
+            if self.health_server is None or self.health_server.ovh_client is None:
+                raise Exception("OVH client not initialized")
+            client = self.health_server.ovh_client
             
-            # Get user info for verification
+            # Get user info for verification (only on the first restart request)
             try:
-                user_info = client.get('/me')
-                logger.info(f"OVH API connected for user: {user_info.get('firstname', 'Unknown')}")
+                user_info = self.health_server.get_ovh_user()
             except Exception as e:
                 logger.error(f"OVH API authentication failed: {e}")
                 raise Exception(f"OVH authentication failed: {str(e)}")
             
-            # Reboot VPS
+            # Reboot VPS in the background and answer immediately
             logger.info(f"Initiating VPS reboot for service: {OVH_SERVICE_NAME}")
-            reboot_result = client.post(f'/vps/{OVH_SERVICE_NAME}/reboot')
+            future = _executor.submit(client.post, f'/vps/{OVH_SERVICE_NAME}/reboot')
+            future.add_done_callback(_log_background_result("VPS reboot"))
             
-            success_response = json.dumps({
-                "status": "success",
-                "message": f"VPS reboot initiated successfully for {OVH_SERVICE_NAME}",
-                "ovh_result": reboot_result,
+            self._write_json(202, {
+                "status": "accepted",
+                "message": f"VPS reboot scheduled for {OVH_SERVICE_NAME}",
                 "user": user_info.get('firstname', 'Unknown'),
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "timestamp": _now_str(),
                 "warning": "Bot will stop responding in ~30 seconds as VPS reboots"
             })
             
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Content-length', str(len(success_response)))
-            self.end_headers()
-            self.wfile.write(success_response.encode())
-            
-            logger.info(f"✅ VPS reboot initiated via OVH API")
+            logger.info(f"✅ VPS reboot scheduled via OVH API")
             
         except Exception as e:
             logger.error(f"Failed to restart VPS: {e}")
-            
-            error_response = json.dumps({
-                "status": "error",
-                "message": f"Failed to restart VPS: {str(e)}",
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            })
-            
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Content-length', str(len(error_response)))
-            self.end_headers()
-            self.wfile.write(error_response.encode())
+            self._write_error(500, f"Failed to restart VPS: {str(e)}")
     
     def send_totalcancel_response(self):
         """Close all positions and cancel all pending orders"""
         try:
             if not self.bot_instance:
-                error_response = json.dumps({
-                    "status": "error",
-                    "message": "Bot instance not available",
-                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                })
-                
-                self.send_response(500)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Content-length', str(len(error_response)))
-                self.end_headers()
-                self.wfile.write(error_response.encode())
+                self._write_error(500, "Bot instance not available")
                 return
             
             logger.info("🚫 TOTAL CANCEL requested via API endpoint")
             
-            # Close all remaining positions
-            logger.info("🔴 Closing all open positions...")
-            self.bot_instance.close_remaining_positions()
-            
-            # Cancel all pending orders  
-            logger.info("🚫 Cancelling all pending orders...")
-            cancel_result = self.bot_instance.cancel_all_pending_orders()
-            
-            # Prepare success response
-            success_response = json.dumps({
-                "status": "success",
-                "message": "All positions closed and orders cancelled successfully",
-                "actions_performed": [
-                    "Closed all open positions",
-                    "Cancelled all pending orders"
+            def total_cancel():
+                # Close all remaining positions
+                logger.info("🔴 Closing all open positions...")
+                self.bot_instance.close_remaining_positions()
+                
+                # Cancel all pending orders
+                logger.info("🚫 Cancelling all pending orders...")
+                cancel_result = self.bot_instance.cancel_all_pending_orders()
+                return f"{cancel_result.get('cancelled_count', 0)} orders cancelled"
+            
+            future = _executor.submit(total_cancel)
+            future.add_done_callback(_log_background_result("Total cancel"))
+            
+            # Prepare accepted response
+            self._write_json(202, {
+                "status": "accepted",
+                "message": "Closing all positions and cancelling orders",
+                "actions_scheduled": [
+                    "Close all open positions",
+                    "Cancel all pending orders"
                 ],
-                "cancelled_orders": cancel_result.get('cancelled_count', 0),
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                "timestamp": _now_str()
             })
             
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Content-length', str(len(success_response)))
-            self.end_headers()
-            self.wfile.write(success_response.encode())
-            
-            logger.info(f"✅ Total cancel completed successfully via API")
+            logger.info(f"✅ Total cancel scheduled via API")
             
         except Exception as e:
             logger.error(f"Failed to execute total cancel: {e}")
-            
-            error_response = json.dumps({
-                "status": "error",
-                "message": f"Failed to execute total cancel: {str(e)}",
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            })
-            
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Content-length', str(len(error_response)))
-            self.end_headers()
-            self.wfile.write(error_response.encode())
+            self._write_error(500, f"Failed to execute total cancel: {str(e)}")
     
     def send_closeall_response(self):
         """Close all open positions"""
         try:
             if not self.bot_instance:
-                error_response = json.dumps({
-                    "status": "error",
-                    "message": "Bot instance not available",
-                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                })
-                
-                self.send_response(500)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Content-length', str(len(error_response)))
-                self.end_headers()
-                self.wfile.write(error_response.encode())
+                self._write_error(500, "Bot instance not available")
                 return
             
             logger.info("🔴 CLOSE ALL POSITIONS requested via API endpoint")
             
-            # Close all remaining positions
-            self.bot_instance.close_remaining_positions()
+            # Close all remaining positions in the background
+            future = _executor.submit(self.bot_instance.close_remaining_positions)
+            future.add_done_callback(_log_background_result("Close all positions"))
             
-            # Prepare success response
-            success_response = json.dumps({
-                "status": "success",
-                "message": "All open positions closed successfully",
-                "action_performed": "Closed all open positions",
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            # Prepare accepted response
+            self._write_json(202, {
+                "status": "accepted",
+                "message": "Closing all open positions",
+                "action_scheduled": "Close all open positions",
+                "timestamp": _now_str()
             })
             
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Content-length', str(len(success_response)))
-            self.end_headers()
-            self.wfile.write(success_response.encode())
-            
-            logger.info(f"✅ Close all positions completed successfully via API")
+            logger.info(f"✅ Close all positions scheduled via API")
             
         except Exception as e:
             logger.error(f"Failed to close all positions: {e}")
-            
-            error_response = json.dumps({
-                "status": "error",
-                "message": f"Failed to close all positions: {str(e)}",
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            })
-            
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Content-length', str(len(error_response)))
-            self.end_headers()
-            self.wfile.write(error_response.encode())
+            self._write_error(500, f"Failed to close all positions: {str(e)}")
     
     def send_be_response(self):
         """Move all positions to break even and cancel pending orders"""
         try:
             if not self.bot_instance:
-                error_response = json.dumps({
-                    "status": "error",
-                    "message": "Bot instance not available",
-                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                })
-                
-                self.send_response(500)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Content-length', str(len(error_response)))
-                self.end_headers()
-                self.wfile.write(error_response.encode())
+                self._write_error(500, "Bot instance not available")
                 return
             
             logger.info("🎯 BREAK EVEN requested via API endpoint")
             
             # Move SL to break even (this also cancels pending orders automatically)
-            self.bot_instance.move_sl_to_break_even()
-            
-            # Prepare success response
-            success_response = json.dumps({
-                "status": "success",
-                "message": "All positions moved to break even and pending orders cancelled",
-                "actions_performed": [
-                    "Moved all stop losses to break even (entry price)",
-                    "Cancelled all pending orders"
+            future = _executor.submit(self.bot_instance.move_sl_to_break_even)
+            future.add_done_callback(_log_background_result("Break even"))
+            
+            # Prepare accepted response
+            self._write_json(202, {
+                "status": "accepted",
+                "message": "Moving all positions to break even and cancelling pending orders",
+                "actions_scheduled": [
+                    "Move all stop losses to break even (entry price)",
+                    "Cancel all pending orders"
                 ],
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                "timestamp": _now_str()
             })
             
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Content-length', str(len(success_response)))
-            self.end_headers()
-            self.wfile.write(success_response.encode())
-            
-            logger.info(f"✅ Break even completed successfully via API")
+            logger.info(f"✅ Break even scheduled via API")
             
         except Exception as e:
             logger.error(f"Failed to move to break even: {e}")
-            
-            error_response = json.dumps({
-                "status": "error",
-                "message": f"Failed to move to break even: {str(e)}",
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            })
-            
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Content-length', str(len(error_response)))
-            self.end_headers()
-            self.wfile.write(error_response.encode())
+            self._write_error(500, f"Failed to move to break even: {str(e)}")
     
     def send_cancelorders_response(self):
         """Cancel all pending orders"""
         try:
             if not self.bot_instance:
-                error_response = json.dumps({
-                    "status": "error",
-                    "message": "Bot instance not available",
-                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                })
-                
-                self.send_response(500)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Content-length', str(len(error_response)))
-                self.end_headers()
-                self.wfile.write(error_response.encode())
+                self._write_error(500, "Bot instance not available")
                 return
             
             logger.info("🚫 CANCEL ORDERS requested via API endpoint")
             
-            # Cancel all pending orders
-            cancel_result = self.bot_instance.cancel_all_pending_orders()
+            # Cancel all pending orders in the background
+            future = _executor.submit(self.bot_instance.cancel_all_pending_orders)
+            future.add_done_callback(_log_background_result("Cancel orders"))
             
-            # Prepare success response
-            success_response = json.dumps({
-                "status": "success",
-                "message": "All pending orders cancelled successfully",
-                "action_performed": "Cancelled all pending orders",
-                "cancelled_orders": cancel_result.get('cancelled_count', 0),
-                "failed_orders": cancel_result.get('failed_count', 0),
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            # Prepare accepted response
+            self._write_json(202, {
+                "status": "accepted",
+                "message": "Cancelling all pending orders",
+                "action_scheduled": "Cancel all pending orders",
+                "timestamp": _now_str()
             })
             
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Content-length', str(len(success_response)))
-            self.end_headers()
-            self.wfile.write(success_response.encode())
-            
-            logger.info(f"✅ Cancel orders completed successfully via API")
+            logger.info(f"✅ Cancel orders scheduled via API")
             
         except Exception as e:
             logger.error(f"Failed to cancel orders: {e}")
-            
-            error_response = json.dumps({
-                "status": "error",
-                "message": f"Failed to cancel orders: {str(e)}",
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            })
-            
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Content-length', str(len(error_response)))
-            self.end_headers()
-            self.wfile.write(error_response.encode())
+            self._write_error(500, f"Failed to cancel orders: {str(e)}")
     
-    def send_log_response(self, lines=40):
+    def send_log_response(self, lines=40, indent=None):
         """Send last N lines from log file"""
         try:
-            log_file = 'direct_mt5_monitor.log'
+            log_file = LOG_FILE
             
             # Check if log file exists
             if not os.path.exists(log_file):
-                error_response = json.dumps({
-                    "status": "error",
-                    "message": "Log file not found",
-                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                })
-                
-                self.send_response(404)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Content-length', str(len(error_response)))
-                self.end_headers()
-                self.wfile.write(error_response.encode())
+                self._write_error(404, "Log file not found")
                 return
             
-            # Read the last N lines from the log file
-            with open(log_file, 'r', encoding='utf-8') as f:
-                all_lines = f.readlines()
-                last_lines = all_lines[-lines:] if len(all_lines) >= lines else all_lines
+            # Read only the last N lines from the mapped log file
+            _, mm, size = _open_log_map()
+            total_lines = _total_log_lines(mm)
+            tail = mm[_tail_offset(mm, lines):size] if mm is not None else b''
+            last_lines = tail.decode('utf-8', errors='replace').split('\n')
+            if last_lines[-1] == '':
+                last_lines.pop()  # Trailing newline of the last line
             
             # Create JSON response with log data
             log_data = {
                 "status": "success",
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "timestamp": _now_str(),
                 "log_file": log_file,
-                "total_lines": len(all_lines),
+                "total_lines": total_lines,
                 "lines_returned": len(last_lines),
                 "lines_requested": lines,
                 "log_content": [line.rstrip() for line in last_lines]  # Remove trailing newlines
             }
             
-            response = json.dumps(log_data, indent=2)
-            
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Content-length', str(len(response)))
-            self.end_headers()
-            self.wfile.write(response.encode())
+            self._write_json(200, log_data, indent)
             
         except Exception as e:
-            error_response = json.dumps({
-                "status": "error",
-                "message": f"Failed to read log file: {str(e)}",
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            })
-            
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Content-length', str(len(error_response)))
-            self.end_headers()
-            self.wfile.write(error_response.encode())
+            self._write_error(500, f"Failed to read log file: {str(e)}")
     
     def send_log_html(self, lines=40):
         """Send last N lines from log file as HTML"""
         try:
-            log_file = 'direct_mt5_monitor.log'
+            log_file = LOG_FILE
             
             # Check if log file exists
             if not os.path.exists(log_file):
@@ -571,61 +643,40 @@ class BotHealthHandler(BaseHTTPRequestHandler):
                 </html>
                 """
                 
-                self.send_response(404)
-                self.send_header('Content-type', 'text/html')
-                self.send_header('Content-length', str(len(html_content)))
-                self.end_headers()
-                self.wfile.write(html_content.encode())
+                self._send_bytes(404, 'text/html', html_content.encode())
                 return
             
-            # Read the last N lines from the log file
-            with open(log_file, 'r', encoding='utf-8') as f:
-                all_lines = f.readlines()
-                last_lines = all_lines[-lines:] if len(all_lines) >= lines else all_lines
-            
-            # Create HTML response
-            html_content = f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <title>MT5 Bot Logs - Last {len(last_lines)} Lines</title>
-                <style>
-                    body {{ font-family: 'Consolas', 'Monaco', monospace; margin: 20px; background-color: #1e1e1e; color: #d4d4d4; }}
-                    h1 {{ color: #569cd6; }}
-                    .log-info {{ background: #2d2d30; padding: 10px; margin: 10px 0; border-radius: 5px; }}
-                    .log-content {{ background: #0c0c0c; padding: 15px; border-radius: 5px; white-space: pre-wrap; font-size: 12px; overflow-x: auto; }}
-                    .refresh-btn {{ background: #007acc; color: white; padding: 8px 16px; border: none; border-radius: 4px; cursor: pointer; margin: 10px 0; }}
-                    .refresh-btn:hover {{ background: #005a9e; }}
-                </style>
-            </head>
-            <body>
-                <h1>📋 MT5 Trading Bot Logs</h1>
-                
-                <div class="log-info">
-                    <strong>File:</strong> {log_file}<br>
-                    <strong>Total Lines:</strong> {len(all_lines):,}<br>
-                    <strong>Showing:</strong> Last {len(last_lines)} lines<br>
-                    <strong>Updated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}<br>
-                    <button class="refresh-btn" onclick="location.reload()">🔄 Refresh</button>
-                    <a href="/log?format=html&lines=100" class="refresh-btn">📄 Show 100 Lines</a>
-                    <a href="/log?format=json" class="refresh-btn">📊 JSON Format</a>
-                </div>
-                
-                <div class="log-content">{''.join(last_lines).replace('<', '&lt;').replace('>', '&gt;')}</div>
-                
-                <script>
-                    // Auto-refresh every 30 seconds
-                    setTimeout(function(){{ location.reload(); }}, 30000);
-                </script>
-            </body>
-            </html>
-            """
-            
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html; charset=utf-8')
-            self.send_header('Content-length', str(len(html_content)))
-            self.end_headers()
-            self.wfile.write(html_content.encode())
+            # Locate the last N lines in the mapped log without copying the file
+            f, mm, size = _open_log_map()
+            total_lines = _total_log_lines(mm)
+            offset = _tail_offset(mm, lines)
+            length = size - offset
+            
+            prologue = _LOG_HTML_PROLOGUE.format(
+                shown=min(lines, total_lines),
+                log_file=log_file,
+                total=total_lines,
+                updated=_now_str()
+            ).encode()
+            
+            # Only log lines containing '<' or '>' need escaping - otherwise
+            # the bytes go straight from the file to the socket
+            tail = None
+            if mm is not None and (mm.find(b'<', offset) != -1 or mm.find(b'>', offset) != -1):
+                tail = mm[offset:size].replace(b'<', b'&lt;').replace(b'>', b'&gt;')
+                length = len(tail)
+            
+            head = self._response_head(200, 'text/html; charset=utf-8',
+                                       len(prologue) + length + len(_LOG_HTML_EPILOGUE))
+            if tail is not None:
+                self.wfile.write(head + prologue + tail + _LOG_HTML_EPILOGUE)
+            elif length and hasattr(os, 'sendfile'):
+                self.wfile.write(head + prologue)
+                self.wfile.flush()  # headers must hit the socket before the file bytes
+                self.connection.sendfile(f, offset, length)
+                self.wfile.write(_LOG_HTML_EPILOGUE)
+            else:
+                self.wfile.write(head + prologue + (mm[offset:size] if length else b'') + _LOG_HTML_EPILOGUE)
             
         except Exception as e:
             error_html = f"""
@@ -635,31 +686,29 @@ class BotHealthHandler(BaseHTTPRequestHandler):
             </html>
             """
             
-            self.send_response(500)
-            self.send_header('Content-type', 'text/html')
-            self.send_header('Content-length', str(len(error_html)))
-            self.end_headers()
-            self.wfile.write(error_html.encode())
+            self._send_bytes(500, 'text/html', error_html.encode())
     
     def send_simple_response(self):
         """Send simple 'Bot is running' response"""
-        response = json.dumps({
-            "message": "MT5 Trading Bot is running",
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "status": "online"
-        })
-        
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.send_header('Content-length', str(len(response)))
-        self.end_headers()
-        self.wfile.write(response.encode())
+        self._send_bytes(200, 'application/json', _SIMPLE_PREFIX + _now_str().encode('ascii') + _SIMPLE_SUFFIX)
     
     def log_message(self, format, *args):
         """Override to suppress HTTP server logs"""
         pass
 
 
+class FastHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server that disables Nagle's algorithm on accepted connections"""
+    
+    daemon_threads = True
+    allow_reuse_address = True
+    
+    def get_request(self):
+        sock, addr = super().get_request()
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock, addr
+
+
 class BotHealthServer:
     """HTTP server for bot health checks"""
     
@@ -668,36 +717,106 @@ class BotHealthServer:
         self.bot_instance = bot_instance
         self.server = None
         self.thread = None
+        
+        # MT5 state for /health, refreshed by a background thread
+        self._snapshot = (False, (), (), None)
+        self._snap_etag = "none"
+        self._snap_lock = threading.Lock()
+        self._snap_stop = threading.Event()
+        self._snap_thread = None
+        
+        # Build the OVH client once and reuse it across /restart requests
+        self.ovh_client = None
+        self.ovh_user = None
+        self._ovh_lock = threading.Lock()
+        if OVH_AVAILABLE and all([OVH_APPLICATION_KEY, OVH_APPLICATION_SECRET, OVH_CONSUMER_KEY, OVH_SERVICE_NAME]):
+            try:
+                self.ovh_client = ovh.Client(
+                    endpoint=OVH_ENDPOINT,
+                    application_key=OVH_APPLICATION_KEY,
+                    application_secret=OVH_APPLICATION_SECRET,
+                    consumer_key=OVH_CONSUMER_KEY,
+                )
+            except Exception as e:
+                logger.error(f"Failed to initialize OVH client: {e}")
+    
+    def get_ovh_user(self):
+        """Return OVH account info, verifying credentials with /me only once"""
+        with self._ovh_lock:
+            if self.ovh_user is None:
+                self.ovh_user = self.ovh_client.get('/me')
+                logger.info(f"OVH API connected for user: {self.ovh_user.get('firstname', 'Unknown')}")
+            return self.ovh_user
+    
+    def get_snapshot(self):
+        """Return the latest (connected, positions, orders, account_info) snapshot and its etag"""
+        with self._snap_lock:
+            return self._snapshot, self._snap_etag
+    
+    def _refresh_snapshot(self):
+        """Poll MT5 once and swap in a fresh snapshot - any failure marks MT5 disconnected"""
+        snapshot = (False, (), (), None)
+        try:
+            if mt5.terminal_info() is not None:
+                snapshot = (True, mt5.positions_get() or (), mt5.orders_get() or (), mt5.account_info())
+        except Exception as e:
+            logger.error(f"Failed to refresh MT5 snapshot: {e}")
+        
+        # Hash only the snapshot fields /health reports - the etag ignores the response timestamp
+        connected, positions, orders, account_info = snapshot
+        state = (connected, len(positions), len(orders),
+                 account_info.balance if account_info else None,
+                 account_info.equity if account_info else None)
+        etag = hashlib.blake2b(repr(state).encode(), digest_size=8).hexdigest()
+        with self._snap_lock:
+            self._snapshot = snapshot
+            self._snap_etag = etag
+    
+    def _snapshot_loop(self):
+        """Refresh the MT5 snapshot every HEALTH_SNAPSHOT_INTERVAL seconds until stopped"""
+        while not self._snap_stop.is_set():
+            self._refresh_snapshot()
+            self._snap_stop.wait(HEALTH_SNAPSHOT_INTERVAL)
     
     def start(self):
         """Start the HTTP server in a separate thread"""
         try:
-            # Create custom handler class with bot instance
-            def handler(*args):
-                BotHealthHandler(*args, bot_instance=self.bot_instance)
+            # Bind the bot instance once - partial avoids a Python frame per connection
+            handler = functools.partial(BotHealthHandler, bot_instance=self.bot_instance, health_server=self)
             
-            self.server = HTTPServer(('0.0.0.0', self.port), handler)
+            self.server = FastHTTPServer(('0.0.0.0', self.port), handler)
             self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
             self.thread.start()
             
-            logger.info(f"🌐 Health check server started on port {self.port}")
-            logger.info(f"   GET http://localhost:{self.port}/health - Detailed status")
-            logger.info(f"   GET http://localhost:{self.port}/alive - Simple alive check")
-            logger.info(f"   GET/POST http://localhost:{self.port}/restart - Restart VPS via OVH API")
-            logger.info(f"   POST http://localhost:{self.port}/totalcancel - Close all positions & cancel orders")
-            logger.info(f"   POST http://localhost:{self.port}/closeall - Close all open positions")
-            logger.info(f"   POST http://localhost:{self.port}/be - Move to break even & cancel orders")
-            logger.info(f"   POST http://localhost:{self.port}/cancelorders - Cancel all pending orders")
-            logger.info(f"   GET http://localhost:{self.port}/log - Last 40 log lines (JSON)")
-            logger.info(f"   GET http://localhost:{self.port}/log?format=html - HTML log viewer")
-            logger.info(f"   GET http://localhost:{self.port}/log?lines=N - Last N log lines")
-            logger.info(f"   GET http://localhost:{self.port}/ - Simple status")
+            # Keep /log total_lines up to date without rescanning the file
+            _install_log_line_counter()
+            
+            # Poll MT5 in the background so /health never waits on the terminal
+            if MT5_AVAILABLE:
+                self._snap_stop.clear()
+                self._snap_thread = threading.Thread(target=self._snapshot_loop, daemon=True)
+                self._snap_thread.start()
+            
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("🌐 Health check server started on port %d", self.port)
+                logger.info("   GET http://localhost:%d/health - Detailed status", self.port)
+                logger.info("   GET http://localhost:%d/alive - Simple alive check", self.port)
+                logger.info("   GET/POST http://localhost:%d/restart - Restart VPS via OVH API", self.port)
+                logger.info("   POST http://localhost:%d/totalcancel - Close all positions & cancel orders", self.port)
+                logger.info("   POST http://localhost:%d/closeall - Close all open positions", self.port)
+                logger.info("   POST http://localhost:%d/be - Move to break even & cancel orders", self.port)
+                logger.info("   POST http://localhost:%d/cancelorders - Cancel all pending orders", self.port)
+                logger.info("   GET http://localhost:%d/log - Last 40 log lines (JSON)", self.port)
+                logger.info("   GET http://localhost:%d/log?format=html - HTML log viewer", self.port)
+                logger.info("   GET http://localhost:%d/log?lines=N - Last N log lines", self.port)
+                logger.info("   GET http://localhost:%d/ - Simple status", self.port)
             
         except Exception as e:
             logger.error(f"Failed to start health server: {e}")
     
     def stop(self):
         """Stop the HTTP server"""
+        self._snap_stop.set()
         if self.server:
             self.server.shutdown()
             self.server.server_close()
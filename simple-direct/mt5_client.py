@@ -3,9 +3,14 @@ MT5 Trading Client Module
 Contains MT5TradingClient class for direct MetaTrader5 trading operations.
 """
 
+import asyncio
+import collections
+import concurrent.futures
 import logging
-from datetime import datetime
-from typing import Dict, Any, Optional
+import operator
+import threading
+import time
+from typing import Dict, Any, Optional, Tuple
 from config import *
 
 # Try to import MetaTrader5 (available on Windows/Wine only)
@@ -16,23 +21,244 @@ except ImportError:
     MT5_AVAILABLE = False
     mt5 = None
 
+# C-level field getters for the entry dicts
+_get_volume = operator.itemgetter('volume')
+_get_price = operator.itemgetter('price')
+
+# Size of the shared order_send worker pool (multi-position signals place up to 9 orders)
+_MAX_SEND_WORKERS = 8
+
+# Timed-out sends hold _send_lock for at most this many MT5_SEND_TIMEOUTs before the next batch goes anyway
+_STRAGGLER_HOLD_FACTOR = 10
+
+# order_send latency telemetry - percentiles over the last _LATENCY_WINDOW sends, logged every _LATENCY_LOG_EVERY sends
+_LATENCY_WINDOW = 200
+_LATENCY_LOG_EVERY = 50
+
+# Log in to a remote VPS account only when all three credentials are configured
+_HAS_VPS_CREDENTIALS = bool(MT5_LOGIN and MT5_PASSWORD and MT5_SERVER)
+
+# MT5 order/position type names, indexed by the type code
+_ORDER_TYPE_NAMES = ("BUY", "SELL", "BUY_LIMIT", "SELL_LIMIT", "BUY_STOP", "SELL_STOP", "BUY_STOP_LIMIT", "SELL_STOP_LIMIT")
+_POS_TYPE_NAMES = ("BUY", "SELL")
+
+# MetaTrader5 trade constants used on the order path, bound once so building and checking orders never goes
+# through the module - the literal values only stand in when the library is not installed
+if MT5_AVAILABLE:
+    _TRADE_ACTION_DEAL = mt5.TRADE_ACTION_DEAL
+    _TRADE_ACTION_PENDING = mt5.TRADE_ACTION_PENDING
+    _ORDER_TYPE_BUY = mt5.ORDER_TYPE_BUY
+    _ORDER_TYPE_SELL = mt5.ORDER_TYPE_SELL
+    _ORDER_TYPE_BUY_LIMIT = mt5.ORDER_TYPE_BUY_LIMIT
+    _ORDER_TYPE_SELL_LIMIT = mt5.ORDER_TYPE_SELL_LIMIT
+    _ORDER_TYPE_BUY_STOP = mt5.ORDER_TYPE_BUY_STOP
+    _ORDER_TYPE_SELL_STOP = mt5.ORDER_TYPE_SELL_STOP
+    _ORDER_FILLING_IOC = mt5.ORDER_FILLING_IOC
+    _ORDER_FILLING_RETURN = mt5.ORDER_FILLING_RETURN
+    _ORDER_TIME_GTC = mt5.ORDER_TIME_GTC
+    _TRADE_RETCODE_DONE = mt5.TRADE_RETCODE_DONE
+    _TRADE_RETCODE_REQUOTE = mt5.TRADE_RETCODE_REQUOTE
+    _TRADE_RETCODE_PRICE_CHANGED = mt5.TRADE_RETCODE_PRICE_CHANGED
+    _TRADE_RETCODE_PRICE_OFF = mt5.TRADE_RETCODE_PRICE_OFF
+else:
+    _TRADE_ACTION_DEAL = 1
+    _TRADE_ACTION_PENDING = 5
+    _ORDER_TYPE_BUY = 0
+    _ORDER_TYPE_SELL = 1
+    _ORDER_TYPE_BUY_LIMIT = 2
+    _ORDER_TYPE_SELL_LIMIT = 3
+    _ORDER_TYPE_BUY_STOP = 4
+    _ORDER_TYPE_SELL_STOP = 5
+    _ORDER_FILLING_IOC = 1
+    _ORDER_FILLING_RETURN = 2
+    _ORDER_TIME_GTC = 0
+    _TRADE_RETCODE_DONE = 10009
+    _TRADE_RETCODE_REQUOTE = 10004
+    _TRADE_RETCODE_PRICE_CHANGED = 10020
+    _TRADE_RETCODE_PRICE_OFF = 10021
+
+_MARKET_ORDER_TYPES = {'buy': _ORDER_TYPE_BUY, 'sell': _ORDER_TYPE_SELL}
+_LIMIT_ORDER_TYPES = (_ORDER_TYPE_BUY_LIMIT, _ORDER_TYPE_SELL_LIMIT)
+
+# Pending order type by (direction, entry below market) - buy below / sell above the market is a limit, otherwise a stop
+_PENDING_ORDER_TYPES = {
+    ('buy', True): _ORDER_TYPE_BUY_LIMIT,
+    ('buy', False): _ORDER_TYPE_BUY_STOP,
+    ('sell', False): _ORDER_TYPE_SELL_LIMIT,
+    ('sell', True): _ORDER_TYPE_SELL_STOP,
+}
+
+# Market order retcodes that get one retry at a fresh tick
+_RETRY_RETCODES = frozenset((_TRADE_RETCODE_REQUOTE, _TRADE_RETCODE_PRICE_CHANGED, _TRADE_RETCODE_PRICE_OFF))
+
+# Constant fields of market / pending order requests - request_templates() adds the signal's symbol and SL
+_MARKET_TEMPLATE = {
+    "action": _TRADE_ACTION_DEAL,
+    "magic": MAGIC_NUMBER,
+    "type_filling": _ORDER_FILLING_IOC,
+}
+_PENDING_TEMPLATE = {
+    "action": _TRADE_ACTION_PENDING,
+    "magic": MAGIC_NUMBER,
+    "type_time": _ORDER_TIME_GTC,
+    "type_filling": _ORDER_FILLING_RETURN,
+}
+
+# Pip size by quote digits - 5/3-digit quotes use a fractional pip
+_PIP_VALUE = {0: 1.0, 1: 0.1, 2: 0.01, 3: 0.01, 4: 0.0001, 5: 0.0001}
+
 logger = logging.getLogger(__name__)
 
 
+def _pip_value(symbol_info) -> float:
+    """Price value of one pip for the symbol (5/3-digit quotes use a fractional pip)"""
+    if not symbol_info:
+        return 0.0001  # Default for most pairs
+    digits = symbol_info.digits
+    return _PIP_VALUE.get(digits) or 10 ** -digits
+
+
+def _tp_price(signal: Dict[str, Any], base_price: float, tp_pips, pip_value: float, digits: int) -> float:
+    """TP tp_pips away from base_price in the trade direction, or the signal's TP when tp_pips is None"""
+    if tp_pips is None:
+        return signal['take_profit']
+    if signal['direction'] == 'buy':
+        return round(base_price + (tp_pips * pip_value), digits)
+    return round(base_price - (tp_pips * pip_value), digits)
+
+
+def _not_connected_result(entries: list) -> Dict[str, Any]:
+    """Failure result for an order batch attempted while MT5 is not connected - nothing is sent"""
+    return {
+        'success': False,
+        'error': "MT5 not connected",
+        'entry_price': entries[0]['price'] if entries else 0,
+        'volume': sum(map(_get_volume, entries))
+    }
+
+
+class _SendTimeout(TimeoutError):
+    """order_send gave no reply within MT5_SEND_TIMEOUT - the order is unconfirmed, it may still be placed"""
+
+
+def _partial_warning(placed: int, unconfirmed: int, total: int) -> str:
+    """Summary warning for a batch that did not place every order"""
+    warning = f'Only {placed}/{total} orders placed successfully'
+    if unconfirmed:
+        warning += f', {unconfirmed} unconfirmed (order_send timed out - check the terminal)'
+    return warning
+
+
+def _log_verify_error(future):
+    """Done-callback for the background placed-order check - log its failure instead of dropping it"""
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("❌ Placed-order verification failed: %s", future.exception())
+
+
+def _pending_order_label(order_type: int, direction: str, entry_price: float, market_price: float, idx: int) -> str:
+    """Human-readable description of a pending order for the execution log"""
+    is_limit = order_type in _LIMIT_ORDER_TYPES
+    side = "below" if is_limit == (direction == 'buy') else "above"
+    return f"{direction.upper()} {'LIMIT' if is_limit else 'STOP'} order {idx} at {entry_price} ({side} market {market_price})"
+
+
+def _order_comment(entry: Dict[str, Any], idx: int, total: int, is_multi_tp: bool, is_market: bool) -> str:
+    """Order comment - 'TG Market ...' for market orders, 'TG MultiTP ...' / 'TG Multi ...' for pending ones"""
+    kind = "Market" if is_market else "MultiTP" if is_multi_tp else "Multi"
+    if is_multi_tp:
+        return f"TG {kind} {entry['tp_level']}/5 {entry['tp_pips'] if entry['tp_pips'] else 'Signal'}p"
+    return f"TG {kind} {idx}/{total} {ENTRY_STRATEGY}"
+
+
+def request_templates(signal: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """(market, pending) request dicts holding the fields shared by every order of a signal"""
+    market = _MARKET_TEMPLATE.copy()
+    pending = _PENDING_TEMPLATE.copy()
+    market["symbol"] = pending["symbol"] = signal['symbol']
+    market["sl"] = pending["sl"] = signal['stop_loss']
+    return market, pending
+
+
+def build_order_request(signal: Dict[str, Any], entry: Dict[str, Any], tick, symbol_info,
+                        idx: int, total: int, is_multi_tp: bool,
+                        templates: Tuple[Dict[str, Any], Dict[str, Any]] = None) -> Tuple[Dict[str, Any], bool]:
+    """Decide the order type for one entry and build its order_send request - no MT5 calls.
+    
+    Returns (request, converted_to_market). Entries within $1 of the market become market
+    orders; multi-TP entries take their TP from tp_pips relative to the price they fill at.
+    Pass the signal's request_templates() to avoid rebuilding the shared fields per order.
+    """
+    market_tmpl, pending_tmpl = templates or request_templates(signal)
+    direction = signal['direction']
+    entry_price = entry['price']
+    current_ask = tick.ask
+    current_bid = tick.bid
+    market_price = current_ask if direction == 'buy' else current_bid
+    
+    digits = symbol_info.digits if symbol_info else None
+    if is_multi_tp:
+        tp_pips = entry['tp_pips']
+        pip_value = _pip_value(symbol_info)
+    else:
+        tp_pips = None
+        pip_value = None
+    
+    # Entry price too close to market price (within ±$1) - use a market order instead
+    if abs(entry_price - market_price) <= 1.0:
+        request = market_tmpl.copy()
+        request["volume"] = entry['volume']
+        request["type"] = _MARKET_ORDER_TYPES[direction]
+        request["tp"] = _tp_price(signal, market_price, tp_pips, pip_value, digits)
+        request["comment"] = _order_comment(entry, idx, total, is_multi_tp, True)
+        return request, True
+    
+    # Determine correct order type based on price relationship
+    order_type_mt5 = _PENDING_ORDER_TYPES[(direction, entry_price < market_price)]
+    
+    request = pending_tmpl.copy()
+    request["volume"] = entry['volume']
+    request["type"] = order_type_mt5
+    request["price"] = entry_price
+    request["tp"] = _tp_price(signal, entry_price, tp_pips, pip_value, digits)
+    request["comment"] = _order_comment(entry, idx, total, is_multi_tp, False)
+    return request, False
+
+
 class MT5TradingClient:
     """Direct MT5 trading via Python library"""
     
     def __init__(self):
         self.connected = False
+        self._symbol_table = {}  # symbol -> SymbolInfo, loaded on connect (only static fields like digits are read)
+        self._tick_cache = {}    # symbol -> (fetched_at, Tick)
+        self._send_lock = asyncio.Lock()  # One order batch in flight at a time
+        self._straggler_task = None  # Holds _send_lock until timed-out sends return
+        self._executor = None  # order_send worker pool, created on first send and shut down in disconnect()
+        self.thread_initializer = None  # Run by each send pool thread as it starts (e.g. to reset CPU affinity)
+        self._send_latencies = collections.deque(maxlen=_LATENCY_WINDOW)  # order_send latencies in ns
+        self._sends_since_stats = 0
         
-    def connect(self) -> bool:
-        """Connect to remote MT5 VPS"""
+        # Local mirror of pending orders / open positions, kept fresh by a background poll thread
+        self._orders = {}     # ticket -> TradeOrder
+        self._positions = {}  # ticket -> TradePosition
+        self._mirror_lock = threading.Lock()
+        self._mirror_thread = None
+        
+        # Background threads (order mirror, keepalive) run until disconnect() sets this
+        self._stop = threading.Event()
+        self._keepalive_thread = None
+        
+    def _login(self) -> bool:
+        """Initialize the terminal, log in and check the account - shared by connect and reconnect"""
+        if not MT5_AVAILABLE:
+            logger.error("MetaTrader5 library not available - cannot connect to MT5")
+            return False
         if not mt5.initialize():
             logger.error("MT5 initialize() failed")
             return False
         
         # Connect to MT5 VPS using credentials
-        if MT5_LOGIN and MT5_PASSWORD and MT5_SERVER:
+        if _HAS_VPS_CREDENTIALS:
             if not mt5.login(MT5_LOGIN, password=MT5_PASSWORD, server=MT5_SERVER):
                 logger.error(f"MT5 login failed: {mt5.last_error()}")
                 return False
@@ -47,12 +273,58 @@ class MT5TradingClient:
             return False
         
         logger.info(f"Account info - Login: {account_info.login}, Balance: {account_info.balance}")
+        return True
+    
+    def connect(self) -> bool:
+        """Connect to remote MT5 VPS"""
+        if not self._login():
+            return False
         self.connected = True
+        self._load_symbol_table()
+        
+        self._stop.clear()
+        if ORDER_MIRROR_INTERVAL > 0 and not self._mirror_thread:
+            self._mirror_thread = threading.Thread(target=self._mirror_loop, daemon=True)
+            self._mirror_thread.start()
+        if MT5_KEEPALIVE_INTERVAL > 0 and not self._keepalive_thread:
+            self._keepalive_thread = threading.Thread(target=self._keepalive_loop, daemon=True)
+            self._keepalive_thread.start()
         return True
     
+    def _load_symbol_table(self):
+        """Load every symbol once so order placement never waits on symbol_info()"""
+        symbols = mt5.symbols_get()
+        if symbols:
+            self._symbol_table = {s.name: s for s in symbols}
+            logger.info(f"Loaded {len(self._symbol_table)} symbols")
+    
+    def _keepalive_loop(self):
+        """Check the terminal every MT5_KEEPALIVE_INTERVAL seconds and log back in when it has dropped"""
+        while not self._stop.wait(MT5_KEEPALIVE_INTERVAL):
+            try:
+                if mt5.terminal_info() is not None:
+                    continue
+                self.connected = False
+                logger.warning(f"⚠️ MT5 terminal connection lost ({mt5.last_error()}) - reconnecting")
+                if self._login():
+                    self.connected = True
+                    logger.info("✅ Reconnected to MT5")
+                    self._load_symbol_table()
+            except Exception as e:
+                logger.error(f"❌ MT5 keepalive failed: {e}")
+    
     def disconnect(self):
         """Disconnect from MT5"""
-        mt5.shutdown()
+        self._stop.set()
+        for thread in (self._mirror_thread, self._keepalive_thread):
+            if thread:
+                thread.join(timeout=2)
+        self._mirror_thread = self._keepalive_thread = None
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        if MT5_AVAILABLE:
+            mt5.shutdown()
         self.connected = False
         logger.info("Disconnected from MT5")
     
@@ -61,55 +333,256 @@ class MT5TradingClient:
         if not self.connected:
             return None
             
-        tick = mt5.symbol_info_tick(symbol)
+        tick = self._get_tick(symbol)
         if tick is None:
             return None
             
         return {'bid': tick.bid, 'ask': tick.ask}
     
-    def check_order_status(self, order_id: int = None):
-        """Check status of orders and positions"""
-        logger.info(f"🔍 CHECKING ORDER STATUS:")
+    def _get_tick(self, symbol: str, max_age: float = 0.1, refresh: bool = False):
+        """Return mt5.symbol_info_tick(symbol), reusing a tick fetched less than max_age seconds ago"""
+        now = time.monotonic()
+        cached = self._tick_cache.get(symbol)
+        if cached and not refresh and now - cached[0] < max_age:
+            return cached[1]
+        tick = mt5.symbol_info_tick(symbol)
+        if tick:
+            self._tick_cache[symbol] = (now, tick)
+        return tick
+    
+    def _get_symbol_info(self, symbol: str):
+        """Return the symbol's SymbolInfo from the startup table, falling back to mt5.symbol_info() on a miss"""
+        symbol_info = self._symbol_table.get(symbol)
+        if symbol_info is None:
+            symbol_info = mt5.symbol_info(symbol)
+            if symbol_info:
+                self._symbol_table[symbol] = symbol_info
+        return symbol_info
+    
+    def _refresh_mirror(self):
+        """Poll orders/positions once, log what opened or closed and swap in the new mirror"""
+        orders = {o.ticket: o for o in (mt5.orders_get() or ())}
+        positions = {p.ticket: p for p in (mt5.positions_get() or ())}
+        
+        with self._mirror_lock:
+            old_orders, old_positions = self._orders, self._positions
+            self._orders, self._positions = orders, positions
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            for ticket in orders.keys() - old_orders.keys():
+                logger.debug("📋 Order %d placed", ticket)
+            for ticket in old_orders.keys() - orders.keys():
+                logger.debug("📋 Order %d filled or removed", ticket)
+            for ticket in positions.keys() - old_positions.keys():
+                logger.debug("📍 Position %d opened", ticket)
+            for ticket in old_positions.keys() - positions.keys():
+                logger.debug("📍 Position %d closed", ticket)
+    
+    def _mirror_loop(self):
+        """Refresh the order/position mirror every ORDER_MIRROR_INTERVAL seconds until disconnected"""
+        while not self._stop.is_set():
+            try:
+                self._refresh_mirror()
+            except Exception as e:
+                logger.error("❌ Order mirror refresh failed: %s", e)
+            self._stop.wait(ORDER_MIRROR_INTERVAL)
+    
+    def get_orders_and_positions(self) -> Tuple[list, list]:
+        """Pending orders and open positions - from the mirror when it is running, else straight from MT5"""
+        if self._mirror_thread:
+            with self._mirror_lock:
+                return list(self._orders.values()), list(self._positions.values())
+        return list(mt5.orders_get() or ()), list(mt5.positions_get() or ())
+    
+    def check_order_status(self, order_id: int = None, verbose: bool = False):
+        """Check status of orders and positions - diagnostic, only runs when verbose or at DEBUG level"""
+        if not self.connected or not logger.isEnabledFor(logging.INFO) or (not verbose and not logger.isEnabledFor(logging.DEBUG)):
+            return
         
-        # Get all pending orders
-        orders = mt5.orders_get()
+        # Served from the local mirror - no terminal round trip while it is running
+        orders, positions = self.get_orders_and_positions()
+        
+        # One log record per section
         if orders:
-            logger.info(f"   📋 PENDING ORDERS ({len(orders)}):")
+            lines = [f"🔍 CHECKING ORDER STATUS:\n   📋 PENDING ORDERS ({len(orders)}):"]
             for order in orders:
                 distance = abs(order.price_open - order.price_current) if order.price_current else 0
-                # Get order type name
-                order_type_names = {
-                    0: "BUY", 1: "SELL", 2: "BUY_LIMIT", 3: "SELL_LIMIT", 
-                    4: "BUY_STOP", 5: "SELL_STOP", 6: "BUY_STOP_LIMIT", 7: "SELL_STOP_LIMIT"
-                }
-                type_name = order_type_names.get(order.type, f"TYPE_{order.type}")
-                logger.info(f"     Order {order.ticket}: {order.symbol} {type_name}")
-                logger.info(f"       Entry: {order.price_open}, Current: {order.price_current}, Distance: {distance:.5f}")
-                logger.info(f"       Volume: {order.volume_initial}, SL: {order.sl}, TP: {order.tp}")
+                type_name = _ORDER_TYPE_NAMES[order.type] if 0 <= order.type < 8 else f"TYPE_{order.type}"
+                lines.append(f"     Order {order.ticket}: {order.symbol} {type_name}\n"
+                             f"       Entry: {order.price_open}, Current: {order.price_current}, Distance: {distance:.5f}\n"
+                             f"       Volume: {order.volume_initial}, SL: {order.sl}, TP: {order.tp}")
+            logger.info("\n".join(lines))
         else:
-            logger.info(f"   📋 No pending orders")
+            logger.info("🔍 CHECKING ORDER STATUS:\n   📋 No pending orders")
         
-        # Get open positions
-        positions = mt5.positions_get()
         if positions:
-            logger.info(f"   📍 OPEN POSITIONS ({len(positions)}):")
+            lines = [f"   📍 OPEN POSITIONS ({len(positions)}):"]
             for pos in positions:
-                # Get position type name
-                pos_type_name = "BUY" if pos.type == 0 else "SELL"
-                logger.info(f"     Position {pos.ticket}: {pos.symbol} {pos_type_name}")
-                logger.info(f"       Open: {pos.price_open}, Current: {pos.price_current}, Profit: ${pos.profit}")
+                lines.append(f"     Position {pos.ticket}: {pos.symbol} {_POS_TYPE_NAMES[pos.type != 0]}\n"
+                             f"       Open: {pos.price_open}, Current: {pos.price_current}, Profit: ${pos.profit}")
+            logger.info("\n".join(lines))
+        else:
+            logger.info("   📍 No open positions")
+    
+    def _verify_placed(self, order_ids: list):
+        """Log whether the terminal shows each placed order as pending, in a position or filled"""
+        # Straight from MT5 rather than the mirror, which can be up to ORDER_MIRROR_INTERVAL behind
+        live = {o.ticket for o in (mt5.orders_get() or ())}
+        # A position's identifier is the ticket of the order that opened it
+        live |= {p.identifier for p in (mt5.positions_get() or ())}
+        missing = []
+        for order_id in order_ids:
+            if order_id in live:
+                continue
+            # Filled into an existing (netting) position or already closed - the order is in the history as filled
+            history = mt5.history_orders_get(ticket=order_id)
+            if not history or history[0].state != mt5.ORDER_STATE_FILLED:
+                missing.append(order_id)
+        if missing:
+            logger.warning("⚠️ %d/%d placed orders not found in the terminal: %s", len(missing), len(order_ids), missing)
         else:
-            logger.info(f"   📍 No open positions")
+            logger.debug("✅ All %d placed orders confirmed in the terminal", len(order_ids))
+    
+    def _verify_placed_later(self, results: list):
+        """Run _verify_placed for a batch's successful orders in the background at DEBUG level - never delays the caller"""
+        order_ids = [r['order_id'] for r in results if r.get('success', False)]
+        if order_ids and logger.isEnabledFor(logging.DEBUG):
+            future = asyncio.get_running_loop().run_in_executor(None, self._verify_placed, order_ids)
+            future.add_done_callback(_log_verify_error)
+    
+    def _order_send_with_retry(self, request: Dict[str, Any]):
+        """mt5.order_send, retrying a requoted market order once at the fresh tick price"""
+        result = mt5.order_send(request)
+        if (result is None or request["action"] != _TRADE_ACTION_DEAL
+                or result.retcode not in _RETRY_RETCODES):
+            return result
+        
+        tick = self._get_tick(request["symbol"], refresh=True)
+        if not tick:
+            return result
+        retry = request.copy()
+        retry["price"] = tick.ask if request["type"] == _ORDER_TYPE_BUY else tick.bid
+        logger.warning("   🔁 %s: %d - %s, retrying at %s", request['comment'], result.retcode, result.comment, retry['price'])
+        return mt5.order_send(retry)
+    
+    def _timed_order_send(self, request: Dict[str, Any], latencies: list, idx: int):
+        """_order_send_with_retry, recording its wall time in latencies[idx] (ns)"""
+        t0 = time.monotonic_ns()
+        try:
+            return self._order_send_with_retry(request)
+        finally:
+            latencies[idx] = time.monotonic_ns() - t0
+    
+    def _record_latencies(self, latencies: list):
+        """Add a batch's send latencies to the reservoir and log percentiles every _LATENCY_LOG_EVERY sends"""
+        self._send_latencies.extend(latencies)
+        self._sends_since_stats += len(latencies)
+        if self._sends_since_stats < _LATENCY_LOG_EVERY:
+            return
+        self._sends_since_stats = 0
+        samples = sorted(self._send_latencies)
+        n = len(samples)
+        logger.info("⏱️ order_send latency over last %d: p50=%.1fms, p95=%.1fms, max=%.1fms", n,
+                    samples[n // 2] / 1e6, samples[min(n - 1, n * 95 // 100)] / 1e6, samples[-1] / 1e6)
+    
+    def _send_orders_sequentially(self, requests: list, latencies: list) -> list:
+        """Send order requests one after another in the calling thread; failed sends come back as exceptions"""
+        sent = []
+        for i, request in enumerate(requests):
+            try:
+                sent.append(self._timed_order_send(request, latencies, i))
+            except Exception as e:
+                sent.append(e)
+        return sent
     
-    def _execute_multi_trades(self, signal: Dict[str, Any], multi_entries: list) -> Dict[str, Any]:
+    async def _send_order(self, loop, request: Dict[str, Any], latencies: list, idx: int, stragglers: list):
+        """_timed_order_send in the send pool, giving up after MT5_SEND_TIMEOUT seconds.
+        
+        A send that times out keeps running in its worker thread - its future goes to stragglers.
+        """
+        future = loop.run_in_executor(self._executor, self._timed_order_send, request, latencies, idx)
+        if MT5_SEND_TIMEOUT <= 0:
+            return await future
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), MT5_SEND_TIMEOUT)
+        except asyncio.TimeoutError:
+            stragglers.append((request, future))
+            raise _SendTimeout(f"no reply from order_send within {MT5_SEND_TIMEOUT}s - order may still be placed") from None
+    
+    async def _release_send_lock_after(self, stragglers: list):
+        """Log the late replies of timed-out sends, then let the next batch send.
+        
+        Gives up waiting after _STRAGGLER_HOLD_FACTOR * MT5_SEND_TIMEOUT seconds so a send that
+        never returns cannot block every later signal; its reply is still logged if it comes.
+        """
+        def log_late_reply(request, future):
+            if future.cancelled():
+                return
+            result = future.exception() or future.result()
+            logger.warning("⏱️ Late order_send reply for %s: %s", request['comment'], result)
+        
+        try:
+            pending = {future: request for request, future in stragglers}
+            for future, request in pending.items():
+                future.add_done_callback(lambda f, request=request: log_late_reply(request, f))
+            hold = _STRAGGLER_HOLD_FACTOR * MT5_SEND_TIMEOUT
+            _, still_pending = await asyncio.wait(pending, timeout=hold)
+            if still_pending:
+                logger.error("❌ %d order_send calls still without reply after %gs (%s) - releasing the send lock anyway",
+                             len(still_pending), hold, ", ".join(pending[f]['comment'] for f in still_pending))
+        finally:
+            self._send_lock.release()
+    
+    async def _send_orders_concurrently(self, requests: list) -> Tuple[list, list]:
+        """Send order requests in parallel worker threads; failed sends come back as exceptions.
+        
+        Returns (results, latencies_ns) in request order. Batches from concurrent signals queue on
+        _send_lock, so only order_send is serialized - request building and result handling of
+        other signals keep running. A send without a reply after MT5_SEND_TIMEOUT seconds comes
+        back as a _SendTimeout with a None latency; _send_lock stays held until it returns (for at
+        most _STRAGGLER_HOLD_FACTOR * MT5_SEND_TIMEOUT seconds), so the next batch does not overlap it. With MT5_ASYNC_SEND=0 the batch is sent one order after
+        another in a single worker thread.
+        """
+        loop = asyncio.get_running_loop()
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=_MAX_SEND_WORKERS, thread_name_prefix="mt5-send",
+                                                                   initializer=self.thread_initializer)
+        latencies = [0] * len(requests)
+        stragglers = []
+        if self._straggler_task is not None and not self._straggler_task.done():
+            logger.warning("⏳ Order batch waiting for timed-out order_send calls of an earlier signal to return")
+        await self._send_lock.acquire()
+        try:
+            if MT5_ASYNC_SEND:
+                sent = await asyncio.gather(
+                    *[self._send_order(loop, request, latencies, i, stragglers) for i, request in enumerate(requests)],
+                    return_exceptions=True
+                )
+            else:
+                sent = await loop.run_in_executor(self._executor, self._send_orders_sequentially, requests, latencies)
+        finally:
+            if stragglers:
+                # Timed-out sends still occupy the terminal - the lock is released once they return
+                self._straggler_task = loop.create_task(self._release_send_lock_after(stragglers))
+            else:
+                self._send_lock.release()
+        
+        # Timed-out legs have no real latency - keep them out of the result and the stats
+        latencies = [None if isinstance(result, _SendTimeout) else latency for result, latency in zip(sent, latencies)]
+        self._record_latencies([latency for latency in latencies if latency is not None])
+        return sent, latencies
+    
+    async def _execute_multi_trades(self, signal: Dict[str, Any], multi_entries: list) -> Dict[str, Any]:
         """Execute multi-entry trades (dual or triple) with flexible volumes"""
+        if not self.connected:
+            return _not_connected_result(multi_entries)
         try:
             symbol = signal['symbol']
             direction = signal['direction']
             entry_count = len(multi_entries)
             
             # Get current market price for order type determination
-            tick = mt5.symbol_info_tick(symbol)
+            tick = self._get_tick(symbol)
             if not tick:
                 return {
                     'success': False,
@@ -121,126 +594,104 @@ class MT5TradingClient:
             current_ask = tick.ask
             current_bid = tick.bid
             
+            # Get symbol info for pip calculation (once per signal, cached across signals)
+            symbol_info = self._get_symbol_info(symbol)
+            
             # Calculate total volume
-            total_volume = sum([entry['volume'] for entry in multi_entries])
+            total_volume = sum(map(_get_volume, multi_entries))
             
-            logger.info(f"🎯 EXECUTING {entry_count} ENTRY ORDERS:")
-            logger.info(f"   Direction: {direction.upper()}")
-            logger.info(f"   Current Market: Bid={current_bid}, Ask={current_ask}")
-            logger.info(f"   Total Volume: {total_volume}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("\n".join([
+                    f"🎯 EXECUTING {entry_count} ENTRY ORDERS:",
+                    f"   Direction: {direction.upper()}",
+                    f"   Current Market: Bid={current_bid}, Ask={current_ask}",
+                    f"   Total Volume: {total_volume}",
+                ] + [f"   Entry {i}/{entry_count}: {entry['price']} - Volume: {entry['volume']}"
+                     for i, entry in enumerate(multi_entries, 1)]))
             
-            for i, entry in enumerate(multi_entries, 1):
-                logger.info(f"   Entry {i}/{entry_count}: {entry['price']} - Volume: {entry['volume']}")
-            
-            results = []
-            successful_orders = 0
-            
-            # Execute all orders
+            # Build all order requests first, then send them concurrently
+            market_price = current_ask if direction == 'buy' else current_bid
+            templates = request_templates(signal)
+            orders = []
             for i, entry in enumerate(multi_entries, 1):
                 entry_price = entry['price']
                 volume = entry['volume']
                 
-                logger.info(f"\n🔄 PLACING ORDER {i}/{entry_count}:")
-                logger.info(f"   Entry Price: {entry_price}")
-                logger.info(f"   Volume: {volume}")
-                
-                # Get symbol info for pip calculation
-                symbol_info = mt5.symbol_info(symbol)
-                if symbol_info:
-                    pip_value = 10 ** (-symbol_info.digits + (1 if symbol_info.digits == 5 or symbol_info.digits == 3 else 0))
-                else:
-                    pip_value = 0.0001  # Default for most pairs
+                request, converted = build_order_request(signal, entry, tick, symbol_info, i, entry_count, False, templates)
+                order_type_mt5 = request['type']
                 
-                # Check if entry price is too close to market price (within ±$1)
-                market_price = current_ask if direction == 'buy' else current_bid
-                price_distance = abs(entry_price - market_price)
-                min_distance = 1.0  # $1 minimum distance
-                
-                if price_distance <= min_distance:
-                    # Market price too close - use market order instead
-                    logger.warning(f"   ⚠️  Entry price {entry_price} too close to market {market_price} (distance: {price_distance:.5f})")
-                    logger.info(f"   🔄 Converting to MARKET order for immediate execution")
-                    
-                    if direction == 'buy':
-                        order_type_mt5 = mt5.ORDER_TYPE_BUY
-                    else:  # sell
-                        order_type_mt5 = mt5.ORDER_TYPE_SELL
-                    
-                    # Market order - no price needed
-                    request = {
-                        "action": mt5.TRADE_ACTION_DEAL,
-                        "symbol": symbol,
-                        "volume": volume,
-                        "type": order_type_mt5,
-                        "sl": signal['stop_loss'],
-                        "tp": signal['take_profit'],
-                        "magic": MAGIC_NUMBER,
-                        "comment": f"TG Market {i}/{entry_count} {ENTRY_STRATEGY}",
-                        "type_filling": mt5.ORDER_FILLING_IOC,
-                    }
-                    logger.info(f"   ✅ {direction.upper()} MARKET order {i} (was limit at {entry_price})")
-                else:
-                    # Determine correct order type based on price relationship
-                    if direction == 'buy':
-                        if entry_price < current_ask:
-                            # Buy below market = BUY LIMIT
-                            order_type_mt5 = mt5.ORDER_TYPE_BUY_LIMIT
-                            logger.info(f"   ✅ BUY LIMIT order {i} at {entry_price} (below market {current_ask})")
-                        else:
-                            # Buy above market = BUY STOP
-                            order_type_mt5 = mt5.ORDER_TYPE_BUY_STOP
-                            logger.info(f"   ✅ BUY STOP order {i} at {entry_price} (above market {current_ask})")
-                    else:  # sell
-                        if entry_price > current_bid:
-                            # Sell above market = SELL LIMIT
-                            order_type_mt5 = mt5.ORDER_TYPE_SELL_LIMIT
-                            logger.info(f"   ✅ SELL LIMIT order {i} at {entry_price} (above market {current_bid})")
-                        else:
-                            # Sell below market = SELL STOP
-                            order_type_mt5 = mt5.ORDER_TYPE_SELL_STOP
-                            logger.info(f"   ✅ SELL STOP order {i} at {entry_price} (below market {current_bid})")
-                    
-                    # Limit order request
-                    request = {
-                        "action": mt5.TRADE_ACTION_PENDING,
-                        "symbol": symbol,
-                        "volume": volume,
-                        "type": order_type_mt5,
-                        "price": entry_price,
-                        "sl": signal['stop_loss'],
-                        "tp": signal['take_profit'],
-                        "magic": MAGIC_NUMBER,
-                        "comment": f"TG Multi {i}/{entry_count} {ENTRY_STRATEGY}",
-                        "type_time": mt5.ORDER_TIME_GTC,
-                        "type_filling": mt5.ORDER_FILLING_RETURN,
-                    }
+                # One log record per order - a market conversion is logged as a warning
+                level = logging.WARNING if converted else logging.INFO
+                if logger.isEnabledFor(level):
+                    lines = [
+                        f"\n🔄 PLACING ORDER {i}/{entry_count}:",
+                        f"   Entry Price: {entry_price}",
+                        f"   Volume: {volume}",
+                    ]
+                    if converted:
+                        lines += [
+                            f"   ⚠️  Entry price {entry_price} too close to market {market_price} (distance: {abs(entry_price - market_price):.5f})",
+                            f"   🔄 Converting to MARKET order for immediate execution",
+                            f"   ✅ {direction.upper()} MARKET order {i} (was limit at {entry_price})",
+                        ]
+                    else:
+                        lines.append(f"   ✅ {_pending_order_label(order_type_mt5, direction, entry_price, market_price, i)}")
+                    logger.log(level, "\n".join(lines))
                 
                 # Debug: Log the complete request before sending
-                logger.info(f"   🔍 DEBUG - Order request details:")
-                logger.info(f"      Symbol: {symbol}")
-                logger.info(f"      Type: {order_type_mt5} ({'MARKET' if request['action'] == mt5.TRADE_ACTION_DEAL else 'LIMIT'})")
-                logger.info(f"      Entry Price: {entry_price}")
-                logger.info(f"      TP Price: {signal['take_profit']}")
-                logger.info(f"      SL Price: {signal['stop_loss']}")
-                logger.info(f"      Volume: {volume}")
-                logger.info(f"      Current Bid: {current_bid}, Ask: {current_ask}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("\n".join([
+                        f"   🔍 DEBUG - Order request details:",
+                        f"      Symbol: {symbol}",
+                        f"      Type: {order_type_mt5} ({'MARKET' if converted else 'LIMIT'})",
+                        f"      Entry Price: {entry_price}",
+                        f"      TP Price: {signal['take_profit']}",
+                        f"      SL Price: {signal['stop_loss']}",
+                        f"      Volume: {volume}",
+                        f"      Current Bid: {current_bid}, Ask: {current_ask}",
+                    ]))
                 
-                # Send order
-                result = mt5.order_send(request)
-                logger.info(f"   📤 Order send result: {result}")
-                    
-                if result is None:
-                    logger.error(f"   ❌ Order {i} failed: mt5.order_send() returned None (connection issue?)")
+                orders.append((entry_price, volume, request))
+            
+            # Send all orders at once - order_send blocks, so each runs in its own worker thread
+            sent, latencies = await self._send_orders_concurrently([request for _, _, request in orders])
+            
+            results = []
+            successful_orders = 0
+            unconfirmed_orders = 0
+            for i, ((entry_price, volume, _), result) in enumerate(zip(orders, sent), 1):
+                if isinstance(result, _SendTimeout):
+                    # No reply yet - neither placed nor failed
+                    logger.warning("   ⏱️ Order %d unconfirmed: %s", i, result)
+                    unconfirmed_orders += 1
+                    results.append({
+                        'entry_price': entry_price,
+                        'volume': volume,
+                        'error': str(result),
+                        'unconfirmed': True,
+                        'success': None
+                    })
+                elif isinstance(result, Exception):
+                    logger.error("   ❌ Order %d failed: %s", i, result)
+                    results.append({
+                        'entry_price': entry_price,
+                        'volume': volume,
+                        'error': f"Exception: {str(result)}",
+                        'success': False
+                    })
+                elif result is None:
+                    logger.error("   ❌ Order %d failed: mt5.order_send() returned None (connection issue?)", i)
                     results.append({
                         'entry_price': entry_price,
                         'volume': volume,
                         'error': "MT5 connection failed - order_send returned None",
                         'success': False
                     })
-                elif result.retcode == mt5.TRADE_RETCODE_DONE:
-                    logger.info(f"   ✅ Order {i} placed successfully!")
-                    logger.info(f"      Order ID: {result.order}")
-                    logger.info(f"      Deal ID: {result.deal}")
+                elif result.retcode == _TRADE_RETCODE_DONE:
+                    logger.info("   📤 Order %d send result: %s\n"
+                                "   ✅ Order %d placed successfully!\n"
+                                "      Order ID: %d\n"
+                                "      Deal ID: %d", i, result, i, result.order, result.deal)
                     successful_orders += 1
                     results.append({
                         'order_id': result.order,
@@ -251,7 +702,8 @@ class MT5TradingClient:
                     })
                 else:
                     # result is not None but failed - safe to access retcode/comment
-                    logger.error(f"   ❌ Order {i} failed: {result.retcode} - {result.comment}")
+                    logger.error("   📤 Order %d send result: %s\n"
+                                 "   ❌ Order %d failed: %d - %s", i, result, i, result.retcode, result.comment)
                     results.append({
                         'entry_price': entry_price,
                         'volume': volume,
@@ -259,15 +711,16 @@ class MT5TradingClient:
                         'success': False
                     })
             
-            # Check order status
-            self.check_order_status()
+            for order_result, latency_ns in zip(results, latencies):
+                order_result['latency_ns'] = latency_ns
+            self._verify_placed_later(results)
             
             # Extract entry prices for return data
-            entry_prices = [entry['price'] for entry in multi_entries]
+            entry_prices = list(map(_get_price, multi_entries))
             
             # Return summary result
             if successful_orders == entry_count:
-                logger.info(f"🎉 MULTI-ENTRY SUCCESS: All {entry_count} orders placed!")
+                logger.info("🎉 MULTI-ENTRY SUCCESS: All %d orders placed!", entry_count)
                 return {
                     'success': True,
                     'multi_entry': True,
@@ -278,21 +731,23 @@ class MT5TradingClient:
                     'entry_prices': entry_prices,
                     'results': results
                 }
-            elif successful_orders > 0:
-                logger.warning(f"⚠️ PARTIAL SUCCESS: {successful_orders}/{entry_count} orders placed")
+            elif successful_orders > 0 or unconfirmed_orders > 0:
+                logger.warning("⚠️ PARTIAL SUCCESS: %d/%d orders placed%s", successful_orders, entry_count,
+                               f", {unconfirmed_orders} unconfirmed" if unconfirmed_orders else "")
                 return {
                     'success': True,
                     'multi_entry': True,
                     'entry_type': 'dual',
                     'entry_price': entry_prices[0] if entry_prices else 0,
                     'orders_placed': successful_orders,
-                    'total_volume': sum([r['volume'] for r in results if r.get('success', False)]),
+                    'total_volume': sum(r['volume'] for r in results if r.get('success', False)),
                     'entry_prices': entry_prices,
                     'results': results,
-                    'warning': f'Only {successful_orders}/{entry_count} orders placed successfully'
+                    'unconfirmed_orders': unconfirmed_orders,
+                    'warning': _partial_warning(successful_orders, unconfirmed_orders, entry_count)
                 }
             else:
-                logger.error(f"❌ MULTI-ENTRY FAILED: No orders placed successfully")
+                logger.error("❌ MULTI-ENTRY FAILED: No orders placed successfully")
                 return {
                     'success': False,
                     'multi_entry': True,
@@ -305,7 +760,7 @@ class MT5TradingClient:
                 }
                 
         except Exception as e:
-            logger.error(f"Exception in multi-entry execution: {e}")
+            logger.error("Exception in multi-entry execution: %s", e)
             return {
                 'success': False,
                 'multi_entry': True,
@@ -314,51 +769,55 @@ class MT5TradingClient:
                 'volume': multi_entries[0].get('volume', 0) if multi_entries else 0
             }
 
-    def _execute_multi_tp_trades(self, signal: Dict[str, Any], multi_tp_entries: list) -> Dict[str, Any]:
+    async def _execute_multi_tp_trades(self, signal: Dict[str, Any], multi_tp_entries: list) -> Dict[str, Any]:
         """Execute multi-TP or multi-position trades with different entry prices and TP levels"""
+        if not self.connected:
+            return _not_connected_result(multi_tp_entries)
         try:
             symbol = signal['symbol']
             direction = signal['direction']
             entry_count = len(multi_tp_entries)
             
             # Get current market price and symbol info
-            tick = mt5.symbol_info_tick(symbol)
-            symbol_info = mt5.symbol_info(symbol)
+            tick = self._get_tick(symbol)
+            symbol_info = self._get_symbol_info(symbol)
             if not tick or not symbol_info:
                 return {
                     'success': False,
                     'error': f"Could not get market data for {symbol}",
                     'entry_price': multi_tp_entries[0]['price'] if multi_tp_entries else 0,
-                    'volume': sum([e['volume'] for e in multi_tp_entries])
+                    'volume': sum(map(_get_volume, multi_tp_entries))
                 }
             
             current_ask = tick.ask
             current_bid = tick.bid
             
             # Calculate pip value for TP calculations
-            pip_value = 10 ** (-symbol_info.digits + (1 if symbol_info.digits == 5 or symbol_info.digits == 3 else 0))
+            pip_value = _pip_value(symbol_info)
             
             # Calculate total volume
-            total_volume = sum([entry['volume'] for entry in multi_tp_entries])
+            total_volume = sum(map(_get_volume, multi_tp_entries))
             
             # Check if all positions use same entry (original multi_tp) or different entries (multi_position)
-            unique_entries = list(set([entry['price'] for entry in multi_tp_entries]))
+            unique_entries = list(set(map(_get_price, multi_tp_entries)))
             is_multi_position = len(unique_entries) > 1
             
-            logger.info(f"🎯 EXECUTING MULTI-{'POSITION' if is_multi_position else 'TP'} ORDERS:")
-            logger.info(f"   Direction: {direction.upper()}")
-            if is_multi_position:
-                logger.info(f"   Entry Prices: {unique_entries}")
-            else:
-                logger.info(f"   Entry Price: {unique_entries[0]}")
-            logger.info(f"   Current Market: Bid={current_bid}, Ask={current_ask}")
-            logger.info(f"   Pip Value: {pip_value}")
-            logger.info(f"   Total Volume: {total_volume}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("\n".join([
+                    f"🎯 EXECUTING MULTI-{'POSITION' if is_multi_position else 'TP'} ORDERS:",
+                    f"   Direction: {direction.upper()}",
+                    f"   Entry Prices: {unique_entries}" if is_multi_position else f"   Entry Price: {unique_entries[0]}",
+                    f"   Current Market: Bid={current_bid}, Ask={current_ask}",
+                    f"   Pip Value: {pip_value}",
+                    f"   Total Volume: {total_volume}",
+                ]))
             
-            results = []
-            successful_orders = 0
-            
-            # Execute all TP orders
+            # Build all TP order requests first, then send them concurrently
+            market_price = current_ask if direction == 'buy' else current_bid
+            digits = symbol_info.digits
+            templates = request_templates(signal)
+            template = None  # (request, converted) of the first order when every entry shares one price
+            orders = []
             for i, entry in enumerate(multi_tp_entries, 1):
                 tp_pips = entry['tp_pips']
                 volume = entry['volume']
@@ -366,106 +825,83 @@ class MT5TradingClient:
                 entry_price = entry['price']  # Use individual entry price for each position
                 position_zone = entry.get('position_zone', 'standard')
                 
-                # Calculate TP price
-                if tp_pips is not None:
-                    # Use pip-based calculation for each position's entry price
-                    if direction == 'buy':
-                        tp_price = entry_price + (tp_pips * pip_value)
-                    else:  # sell
-                        tp_price = entry_price - (tp_pips * pip_value)
-                    tp_price = round(tp_price, symbol_info.digits)
-                    tp_label = f"TP{tp_level} ({tp_pips} pips)"
-                else:
-                    # Use signal's original TP
-                    tp_price = signal['take_profit']
-                    tp_label = f"TP{tp_level} (Signal TP)"
-                
-                logger.info(f"\n🔄 PLACING ORDER {i}/{entry_count}:")
-                logger.info(f"   Entry: {entry_price} ({position_zone})")
-                logger.info(f"   {tp_label}: {tp_price}")
-                logger.info(f"   Volume: {volume}")
-                
-                # Check if entry price is too close to market price (within ±$1)
-                market_price = current_ask if direction == 'buy' else current_bid
-                price_distance = abs(entry_price - market_price)
-                min_distance = 1.0  # $1 minimum distance
+                # TP from this position's entry price (pip-based), or the signal's original TP
+                tp_price = _tp_price(signal, entry_price, tp_pips, pip_value, digits)
+                tp_label = f"TP{tp_level} ({tp_pips} pips)" if tp_pips is not None else f"TP{tp_level} (Signal TP)"
                 
-                if price_distance <= min_distance:
-                    # Market price too close - use market order instead
-                    logger.warning(f"   ⚠️  Entry price {entry_price} too close to market {market_price} (distance: {price_distance:.5f})")
-                    logger.info(f"   🔄 Converting to MARKET order for immediate execution")
-                    
-                    # RECALCULATE TP based on MARKET PRICE instead of range entry price
-                    if tp_pips is not None:
-                        if direction == 'buy':
-                            market_tp_price = market_price + (tp_pips * pip_value)
-                        else:  # sell
-                            market_tp_price = market_price - (tp_pips * pip_value)
-                        market_tp_price = round(market_tp_price, symbol_info.digits)
-                        logger.info(f"   🎯 TP RECALCULATED for MARKET order:")
-                        logger.info(f"      Original TP (from range): {tp_price} (based on {entry_price})")
-                        logger.info(f"      New TP (from market): {market_tp_price} (based on {market_price})")
-                        tp_price = market_tp_price
-                    
-                    if direction == 'buy':
-                        order_type_mt5 = mt5.ORDER_TYPE_BUY
-                    else:  # sell
-                        order_type_mt5 = mt5.ORDER_TYPE_SELL
-                    
-                    # Market order - no price needed
-                    request = {
-                        "action": mt5.TRADE_ACTION_DEAL,
-                        "symbol": symbol,
-                        "volume": volume,
-                        "type": order_type_mt5,
-                        "sl": signal['stop_loss'],
-                        "tp": tp_price,  # Now uses market-based TP calculation
-                        "magic": MAGIC_NUMBER,
-                        "comment": f"TG Market {tp_level}/5 {tp_pips if tp_pips else 'Signal'}p",
-                        "type_filling": mt5.ORDER_FILLING_IOC,
-                    }
-                    logger.info(f"   ✅ {direction.upper()} MARKET order {i} (was limit at {entry_price})")
+                if template is None or is_multi_position:
+                    request, converted = build_order_request(signal, entry, tick, symbol_info, i, entry_count, True, templates)
+                    template = (request, converted)
                 else:
-                    # Determine correct order type based on price relationship
-                    if direction == 'buy':
-                        if entry_price < current_ask:
-                            # Buy below market = BUY LIMIT
-                            order_type_mt5 = mt5.ORDER_TYPE_BUY_LIMIT
-                            logger.info(f"   ✅ BUY LIMIT order {i} at {entry_price} (below market {current_ask})")
-                        else:
-                            # Buy above market = BUY STOP
-                            order_type_mt5 = mt5.ORDER_TYPE_BUY_STOP
-                            logger.info(f"   ✅ BUY STOP order {i} at {entry_price} (above market {current_ask})")
-                    else:  # sell
-                        if entry_price > current_bid:
-                            # Sell above market = SELL LIMIT
-                            order_type_mt5 = mt5.ORDER_TYPE_SELL_LIMIT
-                            logger.info(f"   ✅ SELL LIMIT order {i} at {entry_price} (above market {current_bid})")
-                        else:
-                            # Sell below market = SELL STOP
-                            order_type_mt5 = mt5.ORDER_TYPE_SELL_STOP
-                            logger.info(f"   ✅ SELL STOP order {i} at {entry_price} (below market {current_bid})")
-                    
-                    # Limit order request
-                    request = {
-                        "action": mt5.TRADE_ACTION_PENDING,
-                        "symbol": symbol,
-                        "volume": volume,
-                        "type": order_type_mt5,
-                        "price": entry_price,
-                        "sl": signal['stop_loss'],
-                        "tp": tp_price,
-                        "magic": MAGIC_NUMBER,
-                        "comment": f"TG MultiTP {tp_level}/5 {tp_pips if tp_pips else 'Signal'}p",
-                        "type_time": mt5.ORDER_TIME_GTC,
-                        "type_filling": mt5.ORDER_FILLING_RETURN,
-                    }
+                    # Same entry price - only volume, TP and comment differ from the first order
+                    request = template[0].copy()
+                    converted = template[1]
+                    request['volume'] = volume
+                    request['tp'] = tp_price if not converted else _tp_price(signal, market_price, tp_pips, pip_value, digits)
+                    request['comment'] = _order_comment(entry, i, entry_count, True, converted)
                 
-                # Send order
-                result = mt5.order_send(request)
+                # One log record per order - a market conversion is logged as a warning
+                level = logging.WARNING if converted else logging.INFO
+                if logger.isEnabledFor(level):
+                    lines = [
+                        f"\n🔄 PLACING ORDER {i}/{entry_count}:",
+                        f"   Entry: {entry_price} ({position_zone})",
+                        f"   {tp_label}: {tp_price}",
+                        f"   Volume: {volume}",
+                    ]
+                    if converted:
+                        lines += [
+                            f"   ⚠️  Entry price {entry_price} too close to market {market_price} (distance: {abs(entry_price - market_price):.5f})",
+                            f"   🔄 Converting to MARKET order for immediate execution",
+                        ]
+                        if tp_pips is not None:
+                            # TP was recalculated from the market price instead of the range entry price
+                            lines += [
+                                f"   🎯 TP RECALCULATED for MARKET order:",
+                                f"      Original TP (from range): {tp_price} (based on {entry_price})",
+                                f"      New TP (from market): {request['tp']} (based on {market_price})",
+                            ]
+                        lines.append(f"   ✅ {direction.upper()} MARKET order {i} (was limit at {entry_price})")
+                    else:
+                        lines.append(f"   ✅ {_pending_order_label(request['type'], direction, entry_price, market_price, i)}")
+                    logger.log(level, "\n".join(lines))
                 
-                if result is None:
-                    logger.error(f"   ❌ {tp_label} order failed: mt5.order_send() returned None (connection issue?)")
+                orders.append((entry_price, request['tp'], tp_pips, tp_level, tp_label, volume, request))
+            
+            # Send all orders at once - order_send blocks, so each runs in its own worker thread
+            sent, latencies = await self._send_orders_concurrently([order[-1] for order in orders])
+            
+            results = []
+            successful_orders = 0
+            unconfirmed_orders = 0
+            for (entry_price, tp_price, tp_pips, tp_level, tp_label, volume, _), result in zip(orders, sent):
+                if isinstance(result, _SendTimeout):
+                    # No reply yet - neither placed nor failed
+                    logger.warning("   ⏱️ %s order unconfirmed: %s", tp_label, result)
+                    unconfirmed_orders += 1
+                    results.append({
+                        'entry_price': entry_price,
+                        'tp_price': tp_price,
+                        'tp_pips': tp_pips,
+                        'tp_level': tp_level,
+                        'volume': volume,
+                        'error': str(result),
+                        'unconfirmed': True,
+                        'success': None
+                    })
+                elif isinstance(result, Exception):
+                    logger.error("   ❌ %s order failed: %s", tp_label, result)
+                    results.append({
+                        'entry_price': entry_price,
+                        'tp_price': tp_price,
+                        'tp_pips': tp_pips,
+                        'tp_level': tp_level,
+                        'volume': volume,
+                        'error': f"Exception: {str(result)}",
+                        'success': False
+                    })
+                elif result is None:
+                    logger.error("   ❌ %s order failed: mt5.order_send() returned None (connection issue?)", tp_label)
                     results.append({
                         'entry_price': entry_price,
                         'tp_price': tp_price,
@@ -475,10 +911,10 @@ class MT5TradingClient:
                         'error': "MT5 connection failed - order_send returned None",
                         'success': False
                     })
-                elif result.retcode == mt5.TRADE_RETCODE_DONE:
-                    logger.info(f"   ✅ {tp_label} order placed successfully!")
-                    logger.info(f"      Order ID: {result.order}")
-                    logger.info(f"      Deal ID: {result.deal}")
+                elif result.retcode == _TRADE_RETCODE_DONE:
+                    logger.info("   ✅ %s order placed successfully!\n"
+                                "      Order ID: %d\n"
+                                "      Deal ID: %d", tp_label, result.order, result.deal)
                     successful_orders += 1
                     results.append({
                         'order_id': result.order,
@@ -492,7 +928,7 @@ class MT5TradingClient:
                     })
                 else:
                     # result is not None but failed - safe to access retcode/comment
-                    logger.error(f"   ❌ {tp_label} order failed: {result.retcode} - {result.comment}")
+                    logger.error("   ❌ %s order failed: %d - %s", tp_label, result.retcode, result.comment)
                     results.append({
                         'entry_price': entry_price,
                         'tp_price': tp_price,
@@ -503,14 +939,17 @@ class MT5TradingClient:
                         'success': False
                     })
             
-            # Check order status
-            self.check_order_status()
+            for order_result, latency_ns in zip(results, latencies):
+                order_result['latency_ns'] = latency_ns
+            self._verify_placed_later(results)
             
-            # Return summary result  
-            entry_prices = [r['entry_price'] for r in results if r.get('success', False)]
+            # Return summary result - aggregates come from one filtered list of the placed orders
+            placed = [r for r in results if r.get('success', False)]
+            entry_prices = [r['entry_price'] for r in placed]
+            tp_levels = [f"TP{r['tp_level']}" for r in placed]
             
             if successful_orders == entry_count:
-                logger.info(f"🎉 MULTI-{'POSITION' if is_multi_position else 'TP'} SUCCESS: All {entry_count} orders placed!")
+                logger.info("🎉 MULTI-%s SUCCESS: All %d orders placed!", 'POSITION' if is_multi_position else 'TP', entry_count)
                 return {
                     'success': True,
                     'multi_tp': True,
@@ -519,25 +958,27 @@ class MT5TradingClient:
                     'total_volume': total_volume,
                     'volume': total_volume,  # For backward compatibility
                     'entry_prices': unique_entries,
-                    'tp_levels': [f"TP{r['tp_level']}" for r in results if r.get('success', False)],
+                    'tp_levels': tp_levels,
                     'results': results
                 }
-            elif successful_orders > 0:
-                logger.warning(f"⚠️ PARTIAL SUCCESS: {successful_orders}/{entry_count} orders placed")
+            elif successful_orders > 0 or unconfirmed_orders > 0:
+                logger.warning("⚠️ PARTIAL SUCCESS: %d/%d orders placed%s", successful_orders, entry_count,
+                               f", {unconfirmed_orders} unconfirmed" if unconfirmed_orders else "")
                 return {
                     'success': True,
                     'multi_tp': True,
                     'multi_position': is_multi_position,
                     'entry_price': entry_prices[0] if entry_prices else 0,
                     'orders_placed': successful_orders,
-                    'total_volume': sum([r['volume'] for r in results if r.get('success', False)]),
+                    'total_volume': sum(map(_get_volume, placed)),
                     'entry_prices': entry_prices,
-                    'tp_levels': [f"TP{r['tp_level']}" for r in results if r.get('success', False)],
+                    'tp_levels': tp_levels,
                     'results': results,
-                    'warning': f'Only {successful_orders}/{entry_count} orders placed successfully'
+                    'unconfirmed_orders': unconfirmed_orders,
+                    'warning': _partial_warning(successful_orders, unconfirmed_orders, entry_count)
                 }
             else:
-                logger.error(f"❌ MULTI-{'POSITION' if is_multi_position else 'TP'} FAILED: No orders placed successfully")
+                logger.error("❌ MULTI-%s FAILED: No orders placed successfully", 'POSITION' if is_multi_position else 'TP')
                 return {
                     'success': False,
                     'multi_tp': True,
@@ -550,11 +991,11 @@ class MT5TradingClient:
                 }
                 
         except Exception as e:
-            logger.error(f"Exception in multi-position execution: {e}")
+            logger.error("Exception in multi-position execution: %s", e)
             return {
                 'success': False,
                 'multi_tp': True,
                 'error': f"Exception: {str(e)}",
                 'entry_prices': [e.get('price', 0) for e in multi_tp_entries] if multi_tp_entries else [],
-                'volume': sum([e.get('volume', 0) for e in multi_tp_entries]) if multi_tp_entries else 0
+                'volume': sum(e.get('volume', 0) for e in multi_tp_entries) if multi_tp_entries else 0
             }
\ No newline at end of file
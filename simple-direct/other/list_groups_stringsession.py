@@ -1,10 +1,15 @@
 #!/usr/bin/env python3
 """
 List Telegram groups using StringSession
+
+Set LIST_DIALOGS_LIMIT in .env to change how many dialogs are fetched (default 500).
+Archived chats are skipped.
 """
 
 import asyncio
+import io
 import os
+import sys
 from telethon import TelegramClient
 from telethon.sessions import StringSession
 from dotenv import load_dotenv
@@ -14,6 +19,7 @@ load_dotenv()
 API_ID = os.getenv('TELEGRAM_API_ID')
 API_HASH = os.getenv('TELEGRAM_API_HASH')
 STRING_SESSION = os.getenv('STRING_SESSION')
+LIST_DIALOGS_LIMIT = int(os.getenv('LIST_DIALOGS_LIMIT', '500'))
 
 async def list_groups():
     """List all groups the user is a member of"""
@@ -30,40 +36,48 @@ async def list_groups():
         print("📋 TELEGRAM GROUPS & CHANNELS")
         print("=" * 60)
         
-        dialogs = []
-        async for dialog in client.iter_dialogs():
-            dialogs.append(dialog)
+        dialogs = await client.get_dialogs(limit=LIST_DIALOGS_LIMIT, archived=False, ignore_pinned=False)
         
-        groups = [d for d in dialogs if d.is_group or d.is_channel]
-        users = [d for d in dialogs if d.is_user]
+        # Single pass - only the first 5 users are displayed, the rest are just counted
+        groups = []
+        users = []
+        user_count = 0
+        for d in dialogs:
+            if d.is_group or d.is_channel:
+                groups.append(d)
+            elif d.is_user:
+                user_count += 1
+                if user_count <= 5:
+                    users.append(d)
         
-        print(f"\n🔍 Found {len(groups)} groups/channels and {len(users)} users\n")
+        print(f"\n🔍 Found {len(groups)} groups/channels and {user_count} users\n")
         
+        # Build the listing in memory and write it out in one go
+        out = io.StringIO()
         if groups:
-            print("📢 GROUPS & CHANNELS:")
-            print("-" * 60)
+            out.write("📢 GROUPS & CHANNELS:\n")
+            out.write("-" * 60 + "\n")
             for dialog in groups:
                 entity = dialog.entity
                 group_type = "Channel" if dialog.is_channel else "Group"
-                print(f"📋 {group_type}: {entity.title}")
-                print(f"   ID: {entity.id} (use this for TELEGRAM_GROUP_ID)")
-                print(f"   Username: @{entity.username}" if hasattr(entity, 'username') and entity.username else "   Username: None")
-                print()
+                out.write(f"📋 {group_type}: {entity.title}\n")
+                out.write(f"   ID: {entity.id} (use this for TELEGRAM_GROUP_ID)\n")
+                out.write(f"   Username: @{entity.username}\n\n" if hasattr(entity, 'username') and entity.username else "   Username: None\n\n")
         
         if users:
-            print("👤 RECENT USERS/BOTS:")
-            print("-" * 60)
-            for dialog in users[:5]:  # Show only first 5 users
+            out.write("👤 RECENT USERS/BOTS:\n")
+            out.write("-" * 60 + "\n")
+            for dialog in users:  # Only the first 5 users were kept
                 entity = dialog.entity
                 name = f"{entity.first_name or ''} {entity.last_name or ''}".strip()
-                print(f"👤 User: {name}")
-                print(f"   ID: {entity.id}")
-                print(f"   Username: @{entity.username}" if hasattr(entity, 'username') and entity.username else "   Username: None")
-                print()
+                out.write(f"👤 User: {name}\n")
+                out.write(f"   ID: {entity.id}\n")
+                out.write(f"   Username: @{entity.username}\n\n" if hasattr(entity, 'username') and entity.username else "   Username: None\n\n")
         
-        print("💡 USAGE:")
-        print("Copy the GROUP ID (negative number) to your .env file:")
-        print("TELEGRAM_GROUP_ID=-1234567890")
+        out.write("💡 USAGE:\n")
+        out.write("Copy the GROUP ID (negative number) to your .env file:\n")
+        out.write("TELEGRAM_GROUP_ID=-1234567890\n")
+        sys.stdout.write(out.getvalue())
         
     except Exception as e:
         print(f"❌ Error listing groups: {e}")